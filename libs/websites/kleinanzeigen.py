@@ -1,7 +1,64 @@
+import re
 from typing import Dict, List, Optional, Union, Any
 from playwright.async_api import Page, ElementHandle
 
 
+# Reads every field needed from a listing detail page in one evaluate call.
+# Missing elements are reported as null so the Python parsers can apply the
+# same defaults as the per-selector helpers.
+DETAIL_PAGE_JS = """
+() => {
+    const one = (selector, root = document) => root.querySelector(selector);
+    const all = (selector, root = document) => Array.from(root.querySelectorAll(selector));
+    const innerText = (selector, root = document) => {
+        const element = root ? one(selector, root) : null;
+        return element ? element.innerText : null;
+    };
+    // Locate each container once; nested lookups are scoped to it so the
+    // document is not traversed again for presence checks and children.
+    const title = one("#viewad-title");
+    const image = one("#viewad-image");
+    const detailsRoot = one("#viewad-details");
+    const configurationRoot = one("#viewad-configuration");
+    const extraInfoRoot = one("#viewad-extra-info");
+    return {
+        adId: innerText("#viewad-ad-id-box > ul > li:nth-child(2)"),
+        categories: all(".breadcrump-link").map((e) => e.textContent),
+        title: title ? title.innerText : null,
+        titleClass: title ? title.getAttribute("class") : null,
+        soldBadge: one(".badge-sold") !== null,
+        price: innerText("#viewad-price"),
+        views: innerText("#viewad-cntr-num"),
+        description: innerText("#viewad-description-text"),
+        imageSrc: image ? image.getAttribute("src") : null,
+        seller: {
+            name: innerText(".userprofile-vip"),
+            detailTexts: all(".userprofile-vip-details-text").map((e) => e.innerText),
+            badges: all(".userprofile-vip-badges .userbadge-tag").map((e) => e.textContent),
+        },
+        details: detailsRoot
+            ? all(".addetailslist--detail", detailsRoot).map((item) => {
+                const value = one(".addetailslist--detail--value", item);
+                return {
+                    content: item.textContent,
+                    value: value ? value.textContent : null,
+                };
+            })
+            : null,
+        features: configurationRoot
+            ? all(".checktaglist .checktag", configurationRoot).map((e) => e.textContent)
+            : null,
+        shipping: innerText(".boxedarticle--details--shipping"),
+        locality: innerText("#viewad-locality"),
+        createdAt: innerText(":scope > div:nth-child(1) > span", extraInfoRoot),
+    };
+}
+"""
+
+
+_SELLER_SINCE_PATTERN = re.compile(r"aktiv seit(.*)", re.IGNORECASE)
+
+
 async def get_element_content(
     page: Page, selector: str, default: Any = None
 ) -> Optional[str]:
@@ -16,16 +73,6 @@ async def get_elements_content(page: Page, selector: str) -> List[str]:
     return [await element.text_content() for element in elements]
 
 
-async def get_image_sources(page: Page, selector: str) -> List[str]:
-    images: List[str] = []
-    image_element: Optional[ElementHandle] = await page.query_selector(selector)
-    if image_element:
-        src: Optional[str] = await image_element.get_attribute("src")
-        if src:
-            images.append(src)
-    return images
-
-
 def parse_price(price_text: Optional[str]) -> Dict[str, Union[str, bool]]:
     if not price_text:
         return {"amount": "0", "currency": "€", "negotiable": False}
@@ -40,29 +87,46 @@ def parse_price(price_text: Optional[str]) -> Dict[str, Union[str, bool]]:
     return {"amount": amount, "currency": "€", "negotiable": negotiable}
 
 
-async def get_seller_details(page: Page) -> Dict[str, Optional[str]]:
+def parse_seller_details(seller: Dict[str, Any]) -> Dict[str, Optional[str]]:
     result = {"name": None, "since": None, "type": "private", "badges": []}
 
     try:
-        # Get seller name
-        name_selector = ".userprofile-vip"
-        result["name"] = await get_element_content(page, name_selector)
+        result["name"] = seller.get("name")
+
+        detail_texts: List[str] = seller.get("detailTexts") or []
+        # Matched case-insensitively with collapsed whitespace, like the
+        # `:has-text()` selectors these checks replace
+        normalized_texts: List[str] = [
+            " ".join(text.split()) for text in detail_texts if text
+        ]
 
         # Get seller type
-        type_selector = ".userprofile-vip-details-text:has-text('Privater Nutzer'), .userprofile-vip-details-text:has-text('Gewerblicher Nutzer')"
-        seller_type = await get_element_content(page, type_selector)
+        seller_type = next(
+            (
+                text.casefold()
+                for text in normalized_texts
+                if "privater nutzer" in text.casefold()
+                or "gewerblicher nutzer" in text.casefold()
+            ),
+            None,
+        )
         if seller_type:
-            result["type"] = "business" if "Gewerblicher" in seller_type else "private"
+            result["type"] = "business" if "gewerblicher" in seller_type else "private"
 
         # Get since date
-        since_selector = ".userprofile-vip-details-text:has-text('Aktiv seit')"
-        seller_since = await get_element_content(page, since_selector)
+        seller_since = next(
+            (
+                match
+                for match in map(_SELLER_SINCE_PATTERN.search, normalized_texts)
+                if match
+            ),
+            None,
+        )
         if seller_since:
-            result["since"] = seller_since.replace("Aktiv seit ", "").strip()
+            result["since"] = seller_since.group(1).strip()
 
         # Get user badges
-        badges_selector = ".userprofile-vip-badges .userbadge-tag"
-        badges = await get_elements_content(page, badges_selector)
+        badges = seller.get("badges") or []
         result["badges"] = [
             badge.strip() for badge in badges if badge and badge.strip()
         ]
@@ -73,24 +137,14 @@ async def get_seller_details(page: Page) -> Dict[str, Optional[str]]:
     return result
 
 
-async def get_details(page: Page) -> Dict[str, str]:
+def parse_details(detail_items: List[Dict[str, Optional[str]]]) -> Dict[str, str]:
     details: Dict[str, str] = {}
     try:
-        # Get all detail items
-        detail_items: List[ElementHandle] = await page.query_selector_all(
-            "#viewad-details .addetailslist--detail"
-        )
-
         for item in detail_items:
-            # Extract label (everything before the span)
-            content: str = await item.text_content()
-            # Find the span element inside
-            value_span: Optional[ElementHandle] = await item.query_selector(
-                ".addetailslist--detail--value"
-            )
-
-            if value_span:
-                value: str = await value_span.text_content()
+            content: str = item.get("content") or ""
+            value: Optional[str] = item.get("value")
+
+            if value is not None:
                 # The label is the content without the value
                 label: str = content.replace(value, "").strip()
                 details[label] = value.strip()
@@ -100,14 +154,10 @@ async def get_details(page: Page) -> Dict[str, str]:
     return details
 
 
-async def get_features(page: Page) -> List[str]:
+def parse_features(feature_texts: List[str]) -> List[str]:
     features: List[str] = []
     try:
-        feature_elements: List[ElementHandle] = await page.query_selector_all(
-            "#viewad-configuration .checktaglist .checktag"
-        )
-        for feature in feature_elements:
-            feature_text: str = await feature.text_content()
+        for feature_text in feature_texts:
             if feature_text and feature_text.strip():
                 features.append(feature_text.strip())
     except Exception as e:
@@ -116,8 +166,7 @@ async def get_features(page: Page) -> List[str]:
     return features
 
 
-async def get_location(page: Page) -> Dict[str, str]:
-    location: Optional[str] = await get_element_content(page, "#viewad-locality")
+def parse_location(location: Optional[str]) -> Dict[str, str]:
     if not location:
         return {"zip": "", "city": "", "state": ""}
 
@@ -135,22 +184,12 @@ async def get_location(page: Page) -> Dict[str, str]:
     return {"zip": zip_code, "city": city, "state": state}
 
 
-async def get_extra_info(page: Page) -> Dict[str, Optional[str]]:
+def parse_extra_info(payload: Dict[str, Any]) -> Dict[str, Optional[str]]:
     result: Dict[str, Optional[str]] = {"created_at": None, "views": "0"}
 
-    try:
-        date_element: Optional[ElementHandle] = await page.query_selector(
-            "#viewad-extra-info > div:nth-child(1) > span"
-        )
-        if date_element:
-            result["created_at"] = await date_element.inner_text()
-
-        views_element: Optional[ElementHandle] = await page.query_selector(
-            "#viewad-cntr-num"
-        )
-        if views_element:
-            result["views"] = await views_element.inner_text()
-    except Exception as e:
-        print(f"Error getting extra info: {str(e)}")
+    if payload.get("createdAt") is not None:
+        result["created_at"] = payload["createdAt"]
+    if payload.get("views") is not None:
+        result["views"] = payload["views"]
 
     return result
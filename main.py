@@ -1,5 +1,6 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from routers import (
     inserate_ultra as inserate,
     inserat,
@@ -27,8 +28,8 @@ async def lifespan(app: FastAPI):
     
     logger = logging.getLogger(__name__)
 
-    # Setup uvloop for maximum performance (2-4x improvement)
-    uvloop_enabled = EventLoopOptimizer.setup_uvloop()
+    # uvloop is installed by serve.py before the loop starts; just report it
+    uvloop_enabled = EventLoopOptimizer.uses_uvloop()
 
     # Optimize event loop settings
     EventLoopOptimizer.optimize_event_loop()
@@ -128,7 +129,11 @@ async def lifespan(app: FastAPI):
         logger.info("Application shutdown completed")
 
 
-app = FastAPI(version="1.0.0", lifespan=lifespan)
+app = FastAPI(
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 
 @app.get("/")
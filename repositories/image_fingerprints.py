@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Iterable, List, Optional
+from typing import AsyncIterator, Iterable, List, Optional, Sequence, Tuple
 
-from sqlalchemy import delete, select
+from sqlalchemy import Row, delete, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.models import ImageFingerprint
@@ -21,6 +21,10 @@ class ImageFingerprintRepository:
         stmt = delete(ImageFingerprint).where(ImageFingerprint.listing_id == listing_id)
         await self.session.execute(stmt)
 
+    async def delete_by_ids(self, fingerprint_ids: Iterable[int]) -> None:
+        stmt = delete(ImageFingerprint).where(ImageFingerprint.id.in_(list(fingerprint_ids)))
+        await self.session.execute(stmt)
+
     async def add_fingerprint(
         self,
         *,
@@ -56,6 +60,50 @@ class ImageFingerprintRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def stream_band_candidate_hashes(
+        self,
+        *,
+        hash_method: str,
+        bands: Iterable[Tuple[int, int, int]],
+        exclude_listing: Optional[int] = None,
+        batch_size: int = 4096,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """Stream ``(id, hash_bits, hash_hex)`` rows that equal a query hash in a band.
+
+        Each band is a ``(shift, mask, value)`` triple compared against
+        ``(hash_bits >> shift) & mask``; like ``hash_bits`` itself, masks and
+        values wider than 63 bits are given in two's complement so they fit a
+        BIGINT bind parameter. Rows without ``hash_bits`` are always
+        included so callers can fall back to ``hash_hex``. Rows arrive in
+        batches of ``batch_size`` without being loaded as ORM objects.
+
+        The band expressions are computed per row, so the database still scans
+        every fingerprint of ``hash_method``; only matching rows are sent back.
+        Indexed band columns would avoid the scan but need a schema migration,
+        which this project does not have (tables come from ``create_all``).
+        """
+
+        band_matches = [
+            ImageFingerprint.hash_bits.op(">>")(shift).op("&")(mask) == value
+            for shift, mask, value in bands
+        ]
+        stmt = select(
+            ImageFingerprint.id, ImageFingerprint.hash_bits, ImageFingerprint.hash_hex
+        ).where(
+            ImageFingerprint.hash_method == hash_method,
+            or_(ImageFingerprint.hash_bits.is_(None), *band_matches),
+        )
+        if exclude_listing is not None:
+            stmt = stmt.where(ImageFingerprint.listing_id != exclude_listing)
+        result = await self.session.stream(stmt)
+        async for rows in result.partitions(batch_size):
+            yield rows
+
+    async def list_by_ids(self, fingerprint_ids: Iterable[int]) -> List[ImageFingerprint]:
+        stmt = select(ImageFingerprint).where(ImageFingerprint.id.in_(list(fingerprint_ids)))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     async def list_by_listing(self, listing_id: int) -> List[ImageFingerprint]:
         stmt = select(ImageFingerprint).where(ImageFingerprint.listing_id == listing_id)
         result = await self.session.execute(stmt)
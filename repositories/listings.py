@@ -10,7 +10,7 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from loguru import logger
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.models import Listing
@@ -243,6 +243,35 @@ class ListingRepository:
         listing.update_timestamps()
         return listing
 
+    async def mark_suspicion_many(
+        self,
+        metas: Dict[int, Dict[str, Any]],
+        *,
+        reason: str,
+        confidence: Optional[float],
+    ) -> None:
+        """Flag several listings, keyed by id, with a single bulk UPDATE."""
+
+        if not metas:
+            return
+
+        now = datetime.now(timezone.utc)
+        await self.session.execute(
+            update(Listing),
+            [
+                {
+                    "id": listing_id,
+                    "is_suspicious": True,
+                    "suspicion_reason": reason,
+                    "suspicion_confidence": confidence,
+                    "suspicion_meta": meta,
+                    "last_analyzed_at": now,
+                    "updated_at": now,
+                }
+                for listing_id, meta in metas.items()
+            ],
+        )
+
     async def clear_suspicion(self, listing: Listing) -> Listing:
         listing.is_suspicious = False
         listing.suspicion_reason = None
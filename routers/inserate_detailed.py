@@ -740,27 +740,25 @@ async def get_inserate_with_details(
             # Generate final metrics
             final_metrics = tracker.get_request_metrics()
 
-            # Combine warnings
-            all_warnings = []
-            if listings_response.get("warnings"):
-                all_warnings.extend(listings_response["warnings"])
-            if detail_warnings:
-                all_warnings.extend(detail_warnings)
-            context_warnings = error_ctx.warnings.get_user_friendly_messages()
-            if context_warnings:
-                all_warnings.extend(context_warnings)
+            # Combine warnings, dropping duplicates while preserving order
+            unique_warnings: Dict[str, None] = {}
+            for warning_group in (
+                listings_response.get("warnings") or (),
+                detail_warnings or (),
+                error_ctx.warnings.get_user_friendly_messages(),
+            ):
+                for warning in warning_group:
+                    unique_warnings.setdefault(warning, None)
+            all_warnings = list(unique_warnings)
 
             # Calculate detail success metrics
             detail_success_count = len(raw_detailed_listings)
             detail_total_count = len(listings)
-            detail_success_rate = (
-                (detail_success_count / detail_total_count * 100)
-                if detail_total_count > 0
-                else 0
-            )
+            # listings is non-empty here (empty results return early above)
+            detail_success_rate = detail_success_count * 100.0 / detail_total_count
 
             # Add operation-level warnings for detail phase
-            if detail_success_rate < 80 and detail_total_count > 0:
+            if detail_success_rate < 80:
                 error_ctx.add_warning(
                     f"Low detail fetch success rate: {detail_success_count}/{detail_total_count} ({detail_success_rate:.1f}%)",
                     ErrorSeverity.MEDIUM,
@@ -807,15 +805,11 @@ async def get_inserate_with_details(
             }
 
             if location_filter_stats:
-                origin_coords = (
-                    list(location_filter_stats.origin_coordinates)
-                    if location_filter_stats.origin_coordinates
-                    else None
-                )
+                # Tuples serialize as JSON arrays, so no list() copy is needed
                 response["location_filter"] = {
                     "query": location,
                     "radius_km": location_filter_stats.radius_km,
-                    "origin_coordinates": origin_coords,
+                    "origin_coordinates": location_filter_stats.origin_coordinates,
                     "kept": location_filter_stats.kept_count,
                     "excluded": location_filter_stats.excluded_count,
                     "missing": location_filter_stats.missing_count,
@@ -6,6 +6,7 @@ import asyncio
 import time
 from typing import Dict, Any
 from fastapi import APIRouter, Query, HTTPException, Request
+from playwright.async_api import BrowserContext
 
 from scrapers.inserate_ultra_optimized import ultra_optimized_scrape_inserate
 from scrapers.inserat import get_inserate_details_optimized
@@ -54,7 +55,9 @@ async def get_inserate_with_details(
         if not listings_result.get("success", False):
             raise HTTPException(status_code=500, detail="Failed to fetch listings")
 
-        listings = listings_result.get("results", [])
+        # Pop the results so listings_result does not keep them alive after the
+        # detail phase; only its timing information is needed afterwards.
+        listings = listings_result.pop("results", None) or []
         if not listings:
             return {
                 "success": True,
@@ -69,7 +72,9 @@ async def get_inserate_with_details(
             }
 
         # Phase 2: Fetch details concurrently with controlled concurrency
-        async def fetch_single_detail(listing: Dict[str, Any], index: int):
+        async def fetch_single_detail(
+            listing: Dict[str, Any], index: int, context: BrowserContext
+        ):
             """Fetch details for a single listing."""
             try:
                 listing_id = listing.get("adid")
@@ -77,7 +82,7 @@ async def get_inserate_with_details(
                     return None
 
                 detail_result = await get_inserate_details_optimized(
-                    browser_manager, listing_id
+                    browser_manager, listing_id, context=context
                 )
 
                 if detail_result.get("success", False):
@@ -97,16 +102,27 @@ async def get_inserate_with_details(
         # Control concurrency to prevent resource exhaustion
         semaphore = asyncio.Semaphore(max_concurrent_details)
 
-        async def fetch_with_semaphore(listing, index):
+        async def fetch_with_semaphore(listing, index, context):
             async with semaphore:
-                return await fetch_single_detail(listing, index)
-
-        # Execute detail fetching concurrently
-        detail_tasks = [
-            fetch_with_semaphore(listing, i) for i, listing in enumerate(listings)
-        ]
-
-        detail_results = await asyncio.gather(*detail_tasks, return_exceptions=True)
+                return await fetch_single_detail(listing, index, context)
+
+        # Execute detail fetching concurrently; all pages share one context so
+        # the batch pays for a single context acquisition.
+        detail_context = await browser_manager.get_context()
+        try:
+            detail_tasks = [
+                fetch_with_semaphore(listing, i, detail_context)
+                for i, listing in enumerate(listings)
+            ]
+            detail_results = await asyncio.gather(*detail_tasks, return_exceptions=True)
+        finally:
+            await browser_manager.release_context(detail_context)
+
+        # The per-listing closures only capture their own listing; drop the
+        # summary list and task coroutines so the summaries can be collected
+        # while the response is assembled.
+        listings_found = len(listings)
+        del listings, detail_tasks
 
         # Process results
         combined_data = []
@@ -118,6 +134,11 @@ async def get_inserate_with_details(
                 successful_details += 1
 
         total_time = time.time() - start_time
+        success_rate = (
+            100.0
+            if listings_found == 0
+            else round(successful_details * 100.0 / listings_found, 1)
+        )
 
         # Clean response with minimal metrics
         response = {
@@ -126,11 +147,9 @@ async def get_inserate_with_details(
             "unique_results": len(combined_data),
             "time_taken": round(total_time, 3),
             "performance_metrics": {
-                "listings_found": len(listings),
+                "listings_found": listings_found,
                 "details_fetched": successful_details,
-                "success_rate": round((successful_details / len(listings)) * 100, 1)
-                if listings
-                else 100,
+                "success_rate": success_rate,
                 "listing_phase_time": listings_result.get("time_taken", 0),
                 "detail_phase_time": round(
                     total_time - listings_result.get("time_taken", 0), 3
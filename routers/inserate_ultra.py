@@ -3,6 +3,7 @@ Ultra-optimized router for maximum performance scraping.
 """
 
 from fastapi import APIRouter, Query, Request, HTTPException
+from fastapi.responses import ORJSONResponse
 from scrapers.inserate_ultra_optimized import ultra_optimized_scrape_inserate
 
 router = APIRouter()
@@ -59,7 +60,9 @@ async def get_inserate_ultra_optimized(
             }
             result["performance_metrics"] = essential_metrics
 
-        return result
+        # The payload is plain JSON types already, so hand it to orjson
+        # directly instead of walking it with jsonable_encoder first
+        return ORJSONResponse(content=result)
 
     except HTTPException:
         raise
@@ -1,14 +1,33 @@
 """Expose Prometheus metrics for the API and background services."""
 
-from fastapi import APIRouter, Response
-from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from typing import Iterator
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
 
 router = APIRouter(tags=["monitoring"])
 
+_MEDIA_TYPE = CONTENT_TYPE_LATEST
+
+
+class _SingleFamilyRegistry:
+    """Minimal registry wrapper so one metric family can be rendered at a time."""
+
+    def __init__(self, metric_family) -> None:
+        self._metric_family = metric_family
+
+    def collect(self):
+        return [self._metric_family]
+
+
+def _iter_metrics() -> Iterator[bytes]:
+    for metric_family in REGISTRY.collect():
+        yield generate_latest(_SingleFamilyRegistry(metric_family))
+
 
 @router.get("/metrics")
-async def metrics() -> Response:
-    """Return the Prometheus metrics registry."""
+async def metrics() -> StreamingResponse:
+    """Stream the Prometheus metrics registry one metric family at a time."""
 
-    payload = generate_latest()
-    return Response(content=payload, media_type=CONTENT_TYPE_LATEST)
+    return StreamingResponse(_iter_metrics(), media_type=_MEDIA_TYPE)
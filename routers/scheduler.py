@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse, Response
 
 from schemas import (
     SchedulerJobActionResponse,
@@ -13,7 +14,11 @@ from schemas import (
 )
 from services.scheduler import ScraperJobConfig, SchedulerJobState
 
-router = APIRouter(prefix="/scheduler", tags=["scheduler"])
+router = APIRouter(
+    prefix="/scheduler", tags=["scheduler"], default_response_class=ORJSONResponse
+)
+
+_PARAM_KEYS = ("query", "location", "radius", "min_price", "max_price", "page_count")
 
 
 def _get_scheduler(request: Request):
@@ -24,8 +29,10 @@ def _get_scheduler(request: Request):
 
 
 def _state_to_response(state: SchedulerJobState) -> SchedulerJobResponse:
+    # Scheduler params are validated when jobs are created, whether through
+    # the API or SCRAPER_JOBS, so skip validation and build the response directly.
     params = state.params or {}
-    return SchedulerJobResponse(
+    return SchedulerJobResponse.model_construct(
         id=state.id,
         name=state.name,
         interval_seconds=state.interval_seconds,
@@ -48,11 +55,16 @@ def _state_to_response(state: SchedulerJobState) -> SchedulerJobResponse:
 
 
 @router.get("/jobs", response_model=SchedulerJobsResponse)
-async def list_jobs(request: Request) -> SchedulerJobsResponse:
+async def list_jobs(request: Request) -> Response:
     scheduler = _get_scheduler(request)
+    # list_jobs() returns a fresh snapshot list, so it can be sorted in place.
     states = await scheduler.list_jobs()
-    jobs = [_state_to_response(state) for state in sorted(states, key=lambda s: s.created_at)]
-    return SchedulerJobsResponse(jobs=jobs)
+    states.sort(key=lambda s: s.created_at)
+    jobs = [_state_to_response(state) for state in states]
+    # Serialize straight to JSON in one pydantic-core pass instead of letting
+    # FastAPI revalidate every job; the output matches the response model.
+    body = SchedulerJobsResponse.model_construct(jobs=jobs).model_dump_json()
+    return Response(content=body, media_type="application/json")
 
 
 @router.post(
@@ -91,14 +103,7 @@ async def update_job(request: Request, job_id: int, payload: SchedulerJobUpdate)
     scheduler = _get_scheduler(request)
     update_data = payload.model_dump(exclude_unset=True)
 
-    params = {key: update_data.pop(key) for key in list(update_data.keys()) if key in {
-        "query",
-        "location",
-        "radius",
-        "min_price",
-        "max_price",
-        "page_count",
-    }}
+    params = {key: update_data.pop(key) for key in _PARAM_KEYS if key in update_data}
 
     interval_seconds = update_data.get("interval_seconds")
     is_active = update_data.get("is_active")
@@ -2,19 +2,17 @@
 
 from __future__ import annotations
 
+from typing import List
+
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from db.session import get_session
 from repositories import ListingRepository
 from schemas import ListingPage, ListingResponse
 
-
-def _serialize_listing(listing) -> ListingResponse:
-    data = ListingResponse.model_validate(listing)
-    if data.image_urls is None:
-        data.image_urls = []
-    return data
+_LISTING_LIST_ADAPTER = TypeAdapter(List[ListingResponse])
 
 router = APIRouter(prefix="/stored-listings", tags=["stored-listings"])
 
@@ -38,7 +36,7 @@ async def list_stored_listings(
         search_term=search,
     )
 
-    items = [_serialize_listing(listing) for listing in listings]
+    items = _LISTING_LIST_ADAPTER.validate_python(listings, from_attributes=True)
     return ListingPage(total=total, limit=limit, offset=offset, items=items)
 
 
@@ -51,4 +49,4 @@ async def get_stored_listing(
     listing = await repo.get_by_external_id(external_id)
     if listing is None:
         raise HTTPException(status_code=404, detail="Listing not found")
-    return _serialize_listing(listing)
+    return ListingResponse.model_validate(listing)
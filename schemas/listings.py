@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class SellerSchema(BaseModel):
@@ -59,6 +59,12 @@ class ListingResponse(BaseModel):
         "populate_by_name": True,
     }
 
+    @field_validator("image_urls", mode="before")
+    @classmethod
+    def _none_to_empty_list(cls, value: Any) -> Any:
+        # The image_urls column is nullable; expose missing images as [].
+        return [] if value is None else value
+
 
 class ListingPage(BaseModel):
     total: int
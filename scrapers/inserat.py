@@ -1,19 +1,57 @@
+import asyncio
+import copy
+from collections import OrderedDict
 from fastapi import HTTPException
 from libs.websites import kleinanzeigen as lib
 import re
 import time
-from utils.browser import OptimizedPlaywrightManager
-from utils.performance import PageMetrics
+from utils.browser import OptimizedPlaywrightManager, block_heavy_resources
+from utils.performance import PageMetrics, PerformanceTracker
 from utils.error_handling import (
     WarningManager,
     ErrorLogger,
     ErrorSeverity,
     error_handling_context,
+    retry_delay,
 )
 
+_HORIZONTAL_WHITESPACE_PATTERN = re.compile(r"[ \t]+")
+_NEWLINES_PATTERN = re.compile(r"\n+")
+
+# Shared across calls; ErrorLogger only wraps a named stdlib logger
+_LOGGER = ErrorLogger("inserat_scraper")
+
+# Scraped listing details keyed by listing ID, as (stored_at, details).
+# Scheduler runs re-scan the same queries, so recently scraped listings are
+# served from here instead of opening the page again.
+DETAIL_CACHE_TTL_SECONDS = 300
+DETAIL_CACHE_MAX_SIZE = 2048
+_DETAIL_CACHE: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+
+
+def _get_cached_details(listing_id: str):
+    entry = _DETAIL_CACHE.get(listing_id)
+    if entry is None:
+        return None
+    stored_at, details = entry
+    if time.monotonic() - stored_at > DETAIL_CACHE_TTL_SECONDS:
+        del _DETAIL_CACHE[listing_id]
+        return None
+    _DETAIL_CACHE.move_to_end(listing_id)
+    # Callers may modify the nested data, which must not leak into the cache
+    return copy.deepcopy(details)
+
+
+def _cache_details(listing_id: str, details: dict) -> None:
+    _DETAIL_CACHE[listing_id] = (time.monotonic(), copy.deepcopy(details))
+    _DETAIL_CACHE.move_to_end(listing_id)
+    while len(_DETAIL_CACHE) > DETAIL_CACHE_MAX_SIZE:
+        _DETAIL_CACHE.popitem(last=False)
+
 
 async def get_inserate_details(url: str, page):
     try:
+        await page.route("**/*", block_heavy_resources)
         await page.goto(url, timeout=120000)
 
         try:
@@ -23,26 +61,17 @@ async def get_inserate_details(url: str, page):
         except Exception as e:
             print(f"[WARNING] Views element did not appear within 5 seconds: {e}")
 
-        ad_id = await lib.get_element_content(
-            page,
-            "#viewad-ad-id-box > ul > li:nth-child(2)",
-            default="[ERROR] Ad ID not found",
-        )
-        categories = [
-            cat.strip()
-            for cat in await lib.get_elements_content(page, ".breadcrump-link")
-            if cat.strip()
-        ]
-        title = await lib.get_element_content(
-            page, "#viewad-title", default="[ERROR] Title not found"
-        )
+        # Harvest all raw fields in a single round-trip, then parse in Python
+        raw = await page.evaluate(lib.DETAIL_PAGE_JS)
+
+        ad_id = raw["adId"] if raw["adId"] is not None else "[ERROR] Ad ID not found"
+        categories = [cat.strip() for cat in raw["categories"] if cat.strip()]
+        title = raw["title"] if raw["title"] is not None else "[ERROR] Title not found"
 
         # Extract status from title element
         status = "active"  # Default status
-        title_element = await page.query_selector("#viewad-title")
-        if title_element:
-            title_text = await title_element.inner_text()
-
+        title_text = raw["title"]
+        if title_text is not None:
             # Check for specific status indicators in the title text
             if "Verkauft" in title_text:
                 status = "sold"
@@ -52,39 +81,54 @@ async def get_inserate_details(url: str, page):
                 status = "deleted"
 
             # Additional check for sold class
-            title_classes = await title_element.get_attribute("class")
+            title_classes = raw["titleClass"]
             if title_classes and "is-sold" in title_classes:
                 status = "sold"
 
         # Final check for sold status in the page content
-        sold_badge = await page.query_selector(".badge-sold")
-        if sold_badge:
+        if raw["soldBadge"]:
             status = "sold"
 
-        price_element = await lib.get_element_content(page, "#viewad-price")
-        price = lib.parse_price(price_element)
-        views = await lib.get_element_content(page, "#viewad-cntr-num")
-        description = await lib.get_element_content(page, "#viewad-description-text")
+        clean_title = (
+            title.split(" • ")[-1].strip() if " • " in title else title.strip()
+        )
+
+        # Deleted listings carry no usable content; skip the remaining parsing
+        if status == "deleted":
+            return {
+                "id": ad_id,
+                "categories": categories,
+                "title": clean_title,
+                "status": status,
+                "price": None,
+                "delivery": None,
+                "location": None,
+                "views": raw["views"] or "0",
+                "description": None,
+                "images": [],
+                "details": {},
+                "features": {},
+                "seller": None,
+                "extra_info": None,
+            }
+
+        price = lib.parse_price(raw["price"])
+        views = raw["views"]
+        description = raw["description"]
         if description:
-            description = re.sub(r"[ \t]+", " ", description).strip()
-            description = re.sub(r"\n+", "\n", description)
+            description = _HORIZONTAL_WHITESPACE_PATTERN.sub(" ", description).strip()
+            description = _NEWLINES_PATTERN.sub("\n", description)
 
-        images = await lib.get_image_sources(page, "#viewad-image")
-        seller_details = await lib.get_seller_details(page)
+        images = [raw["imageSrc"]] if raw["imageSrc"] else []
+        seller_details = lib.parse_seller_details(raw["seller"])
         details = (
-            await lib.get_details(page)
-            if await page.query_selector("#viewad-details")
-            else {}
+            lib.parse_details(raw["details"]) if raw["details"] is not None else {}
         )
         features = (
-            await lib.get_features(page)
-            if await page.query_selector("#viewad-configuration")
-            else {}
+            lib.parse_features(raw["features"]) if raw["features"] is not None else {}
         )
 
-        shipping_text = await lib.get_element_content(
-            page, ".boxedarticle--details--shipping"
-        )
+        shipping_text = raw["shipping"]
         shipping = None
         if shipping_text:
             if "Nur Abholung" in shipping_text:
@@ -92,15 +136,13 @@ async def get_inserate_details(url: str, page):
             elif "Versand" in shipping_text:
                 shipping = "shipping"
 
-        location = await lib.get_location(page)
-        extra_info = await lib.get_extra_info(page)
+        location = lib.parse_location(raw["locality"])
+        extra_info = lib.parse_extra_info(raw)
 
         return {
             "id": ad_id,
             "categories": categories,
-            "title": title.split(" • ")[-1].strip()
-            if " • " in title
-            else title.strip(),
+            "title": clean_title,
             "status": status,
             "price": price,
             "delivery": shipping,
@@ -119,7 +161,10 @@ async def get_inserate_details(url: str, page):
 
 
 async def get_inserate_details_optimized(
-    browser_manager: OptimizedPlaywrightManager, listing_id: str, retry_count: int = 2
+    browser_manager: OptimizedPlaywrightManager,
+    listing_id: str,
+    retry_count: int = 2,
+    context=None,
 ) -> dict:
     """
     Optimized version of get_inserate_details with comprehensive error handling and performance tracking.
@@ -128,20 +173,51 @@ async def get_inserate_details_optimized(
         browser_manager: OptimizedPlaywrightManager instance
         listing_id: The listing ID to fetch details for
         retry_count: Maximum number of retries (default: 2)
+        context: Optional browser context shared by a batch of detail fetches.
+            The caller owns it; otherwise one is taken from the pool per attempt.
 
     Returns:
         Dictionary containing listing details, performance metrics, and warnings
     """
-    from utils.performance import PerformanceTracker
-
     # Initialize error handling and performance tracking
-    logger = ErrorLogger("inserat_scraper")
+    logger = _LOGGER
     warning_manager = WarningManager()
     tracker = PerformanceTracker()
     tracker.start_request()
 
     url = f"https://www.kleinanzeigen.de/s-anzeige/{listing_id}"
 
+    cached = _get_cached_details(listing_id)
+    if cached is not None:
+        # Metrics describe this request, not the fetch that filled the cache
+        now = time.time()
+        tracker.add_page_metric(
+            PageMetrics(
+                page_number=1,
+                url=url,
+                start_time=now,
+                end_time=now,
+                success=True,
+                retry_count=0,
+                error_message=None,
+                results_count=1,
+            )
+        )
+        browser_metrics = browser_manager.get_performance_metrics()
+        tracker.set_browser_contexts_used(
+            browser_metrics["contexts_in_use"] + browser_metrics["contexts_in_pool"]
+        )
+        tracker.set_concurrent_level(1)
+        request_metrics = tracker.get_request_metrics()
+        return {
+            "success": True,
+            "data": cached,
+            "cached": True,
+            "time_taken": round(request_metrics.total_time, 3),
+            "performance_metrics": request_metrics.to_dict(),
+            "browser_metrics": browser_metrics,
+        }
+
     with error_handling_context(
         operation="fetch_listing_details", listing_id=listing_id, url=url, logger=logger
     ) as error_ctx:
@@ -153,10 +229,13 @@ async def get_inserate_details_optimized(
             try:
                 # Use semaphore-controlled execution
                 async def fetch_operation():
-                    context = await browser_manager.get_context()
+                    owns_context = context is None
+                    page_context = (
+                        await browser_manager.get_context() if owns_context else context
+                    )
                     page = None
                     try:
-                        page = await context.new_page()
+                        page = await page_context.new_page()
 
                         # Get listing details using existing function
                         details = await get_inserate_details(url, page)
@@ -187,7 +266,8 @@ async def get_inserate_details_optimized(
                     finally:
                         if page:
                             await page.close()
-                        await browser_manager.release_context(context)
+                        if owns_context:
+                            await browser_manager.release_context(page_context)
 
                 # Execute with concurrency control
                 details = await browser_manager.execute_with_semaphore(
@@ -204,7 +284,7 @@ async def get_inserate_details_optimized(
                     retry_count=attempt,
                     error_message=None,
                     results_count=1,
-                    warning_count=len(warning_manager.get_warnings()),
+                    warning_count=len(warning_manager.warnings),
                 )
                 tracker.add_page_metric(page_metric)
 
@@ -239,13 +319,15 @@ async def get_inserate_details_optimized(
                     "browser_metrics": browser_metrics,
                 }
 
-                # Add warning information if present
-                warnings = warning_manager.get_warnings()
+                # Add warning information if present; read the list directly
+                # so the common no-warning path doesn't copy it
+                warnings = warning_manager.warnings
                 if warnings:
                     response["warnings"] = warning_manager.get_user_friendly_messages()
                     response["detailed_warnings"] = [w.to_dict() for w in warnings]
                     response["warning_summary"] = warning_manager.get_warning_summary()
 
+                _cache_details(listing_id, details)
                 return response
 
             except Exception as e:
@@ -266,10 +348,7 @@ async def get_inserate_details_optimized(
                     )
 
                     # Exponential backoff with jitter
-                    import asyncio
-                    import random
-
-                    wait_time = (2**attempt) + random.uniform(0, 1)
+                    wait_time = retry_delay(attempt)
                     await asyncio.sleep(wait_time)
                     continue
 
@@ -1,15 +1,23 @@
 import asyncio
 import json
+import re
 import time
-import random
+from functools import lru_cache
+from itertools import chain
 from urllib.parse import urlencode
 
+import orjson
+
 from typing import Optional
-from playwright.async_api import ElementHandle
 
 from fastapi import HTTPException
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-from utils.browser import PlaywrightManager, OptimizedPlaywrightManager
+from utils.browser import (
+    PlaywrightManager,
+    OptimizedPlaywrightManager,
+    block_heavy_resources,
+)
 from utils.performance import PageMetrics, track_page_performance
 from utils.error_handling import (
     ErrorClassifier,
@@ -18,6 +26,7 @@ from utils.error_handling import (
     ErrorContext,
     ErrorSeverity,
     error_handling_context,
+    retry_delay,
 )
 
 
@@ -27,6 +36,55 @@ IMAGE_SELECTORS = [
     "div.aditem-main--top--left img.imagebox-thumbnail",
 ]
 PLACEHOLDER_TOKENS = ("placeholder", "data:image")
+_PLACEHOLDER_PATTERN = re.compile("|".join(map(re.escape, PLACEHOLDER_TOKENS)))
+# First URL of a srcset attribute
+_SRCSET_FIRST_URL_PATTERN = re.compile(r"\s*([^,\s]+)")
+MAX_CONCURRENT_PAGES = 5
+# Currency sign, "VB" (negotiable) marker and thousands separator
+PRICE_NOISE_PATTERN = re.compile(r"€|VB|\.")
+LISTING_ARTICLE_SELECTOR = (
+    ".ad-listitem:not(.is-topad):not(.badge-hint-pro-small-srp) article"
+)
+
+IMAGE_ATTRIBUTES = ("src", "data-src", "data-imgsrc", "data-img-src")
+
+# Runs once per results page over the articles matched by a locator and returns
+# every field get_ads needs, including the raw image candidates, so no
+# per-article element handles are required.
+EXTRACT_ADS_JS = (
+    """
+(articles) => articles.map((article) => {
+    const adid = article.getAttribute("data-adid");
+    const href = article.getAttribute("data-href");
+    // Rows without an id or link are dropped, so don't read anything else
+    if (!adid || !href) return null;
+    const text = (childSelector) => {
+        const element = article.querySelector(childSelector);
+        return element ? element.innerText : "";
+    };
+    let image = null;
+    for (const imageSelector of __IMAGE_SELECTORS__) {
+        image = article.querySelector(imageSelector);
+        if (image) break;
+    }
+    const ldJson = article.querySelector("script[type='application/ld+json']");
+    return {
+        adid,
+        href,
+        title: text("h2.text-module-begin a.ellipsis"),
+        price: text("p.aditem-main--middle--price-shipping--price"),
+        description: text("p.aditem-main--middle--description"),
+        imageAttributes: image
+            ? __IMAGE_ATTRIBUTES__.map((name) => image.getAttribute(name))
+            : [],
+        imageSrcset: image ? image.getAttribute("srcset") : null,
+        ldJson: ldJson ? ldJson.textContent : null,
+    };
+})
+"""
+    .replace("__IMAGE_SELECTORS__", json.dumps(IMAGE_SELECTORS))
+    .replace("__IMAGE_ATTRIBUTES__", json.dumps(IMAGE_ATTRIBUTES))
+)
 
 
 def _normalize_image_url(url: Optional[str]) -> Optional[str]:
@@ -40,121 +98,104 @@ def _normalize_image_url(url: Optional[str]) -> Optional[str]:
     return normalized
 
 
-async def extract_listing_image_url(article: ElementHandle) -> Optional[str]:
+def select_listing_image_url(row: dict) -> Optional[str]:
     """
-    Try multiple selectors and attribute combinations to extract a usable image URL.
-    Falls back to structured data if the <img> tag cannot be accessed.
+    Pick the image URL from candidates harvested by EXTRACT_ADS_JS.
+    Image attributes win, then the first srcset entry, then structured data;
+    placeholder images are skipped at every step.
     """
-    image_element: Optional[ElementHandle] = None
-
-    for selector in IMAGE_SELECTORS:
-        image_element = await article.query_selector(selector)
-        if image_element:
+    image_url: Optional[str] = None
+    for candidate in row["imageAttributes"]:
+        candidate = _normalize_image_url(candidate)
+        if candidate and not _PLACEHOLDER_PATTERN.search(candidate):
+            image_url = candidate
             break
 
-    image_url: Optional[str] = None
-    if image_element:
-        for attribute in ("src", "data-src", "data-imgsrc", "data-img-src"):
-            candidate = await image_element.get_attribute(attribute)
-            candidate = _normalize_image_url(candidate)
-            if candidate and not any(
-                token in candidate for token in PLACEHOLDER_TOKENS
-            ):
-                image_url = candidate
-                break
-
-        if not image_url:
-            srcset = await image_element.get_attribute("srcset")
-            if srcset:
-                first_src = srcset.split(",")[0].strip().split(" ")[0]
-                first_src = _normalize_image_url(first_src)
-                if first_src and not any(
-                    token in first_src for token in PLACEHOLDER_TOKENS
-                ):
-                    image_url = first_src
+    if not image_url:
+        srcset = row["imageSrcset"]
+        if srcset:
+            match = _SRCSET_FIRST_URL_PATTERN.match(srcset)
+            first_src = _normalize_image_url(match.group(1)) if match else None
+            if first_src and not _PLACEHOLDER_PATTERN.search(first_src):
+                image_url = first_src
 
     if not image_url:
-        ld_json_element = await article.query_selector(
-            "script[type='application/ld+json']"
-        )
-        if ld_json_element:
+        raw_json = row["ldJson"]
+        if raw_json:
             try:
-                raw_json = await ld_json_element.inner_text()
-                if raw_json:
-                    data = json.loads(raw_json)
-                    candidate = data.get("contentUrl") or data.get("contentURL")
-                    if isinstance(candidate, list):
-                        candidate = candidate[0] if candidate else None
-                    image_url = _normalize_image_url(candidate)
+                data = orjson.loads(raw_json)
+                candidate = data.get("contentUrl") or data.get("contentURL")
+                if isinstance(candidate, list):
+                    candidate = candidate[0] if candidate else None
+                # Attribute and srcset candidates are already filtered, so
+                # only structured data needs the placeholder check
+                candidate = _normalize_image_url(candidate)
+                if candidate and not _PLACEHOLDER_PATTERN.search(candidate):
+                    image_url = candidate
             except Exception:
                 # Ignore malformed JSON and continue without an image
                 image_url = None
 
-    if image_url and not any(token in image_url for token in PLACEHOLDER_TOKENS):
-        return image_url
-    return None
+    return image_url
 
 
 async def get_ads(page):
     try:
-        items = await page.query_selector_all(
-            ".ad-listitem:not(.is-topad):not(.badge-hint-pro-small-srp)"
+        # Read every field, image candidates included, in a single evaluate
+        # call instead of several CDP round-trips per article.
+        rows = await page.locator(LISTING_ARTICLE_SELECTOR).evaluate_all(
+            EXTRACT_ADS_JS
         )
         results = []
-        for item in items:
-            article = await item.query_selector("article")
-            if article:
-                data_adid = await article.get_attribute("data-adid")
-                data_href = await article.get_attribute("data-href")
-                # Get title from h2 element
-                title_element = await article.query_selector(
-                    "h2.text-module-begin a.ellipsis"
-                )
-                title_text = await title_element.inner_text() if title_element else ""
-                # Get price and description
-                price = await article.query_selector(
-                    "p.aditem-main--middle--price-shipping--price"
-                )
-                # strip € and VB and strip whitespace
-                price_text = await price.inner_text() if price else ""
-                price_text = (
-                    price_text.replace("€", "")
-                    .replace("VB", "")
-                    .replace(".", "")
-                    .strip()
-                )
-                description = await article.query_selector(
-                    "p.aditem-main--middle--description"
-                )
-                description_text = await description.inner_text() if description else ""
-                
-                image_url = await extract_listing_image_url(article)
-
-                if data_adid and data_href:
-                    data_href = f"https://www.kleinanzeigen.de{data_href}"
-                    results.append(
-                        {
-                            "adid": data_adid,
-                            "url": data_href,
-                            "title": title_text,
-                            "price": price_text,
-                            "description": description_text,
-                            "image": image_url,
-                        }
-                    )
+        for row in rows:
+            # The extractor returns null for articles without an id or link
+            if row is None:
+                continue
+            data_adid = row["adid"]
+            data_href = row["href"]
+
+            # strip € and VB and strip whitespace
+            price_text = PRICE_NOISE_PATTERN.sub("", row["price"]).strip()
+            image_url = select_listing_image_url(row)
+
+            results.append(
+                {
+                    "adid": data_adid,
+                    "url": f"https://www.kleinanzeigen.de{data_href}",
+                    "title": row["title"],
+                    "price": price_text,
+                    "description": row["description"],
+                    "image": image_url,
+                }
+            )
         return results
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-async def fetch_page(browser_manager: PlaywrightManager, url: str):
-    page = await browser_manager.new_context_page()
+async def fetch_page(browser_manager: PlaywrightManager, url: str, context=None):
+    # With a shared context only the page is opened and closed here
+    if context is not None:
+        page = await context.new_page()
+    else:
+        page = await browser_manager.new_context_page()
     try:
-        await page.goto(url, timeout=120000)
-        await page.wait_for_load_state("networkidle")
+        await page.route("**/*", block_heavy_resources)
+        await page.goto(url, timeout=120000, wait_until="domcontentloaded")
+        # Only the listing DOM is read, so don't wait for trackers and images
+        try:
+            await page.wait_for_selector(
+                ".ad-listitem", state="attached", timeout=30000
+            )
+        except PlaywrightTimeoutError:
+            # Continue even if selector not found - might be empty page
+            pass
         return await get_ads(page)
     finally:
-        await browser_manager.close_page(page)
+        if context is not None:
+            await page.close()
+        else:
+            await browser_manager.close_page(page)
 
 
 async def optimized_fetch_page(
@@ -163,6 +204,7 @@ async def optimized_fetch_page(
     page_num: int,
     retry_count: int = 2,
     logger: ErrorLogger = None,
+    context=None,
 ) -> tuple[list, PageMetrics]:
     """
     Optimized page fetching with comprehensive error handling and performance tracking.
@@ -173,6 +215,8 @@ async def optimized_fetch_page(
         page_num: Page number for tracking
         retry_count: Maximum number of retries (default: 2)
         logger: Optional error logger instance
+        context: Optional browser context shared by all pages of a scrape.
+            The caller owns it; otherwise one is taken from the pool per attempt.
 
     Returns:
         Tuple of (results_list, PageMetrics)
@@ -180,118 +224,166 @@ async def optimized_fetch_page(
     if logger is None:
         logger = ErrorLogger()
 
-    with error_handling_context(
-        operation="fetch_page", page_number=page_num, url=url, logger=logger
-    ) as error_ctx:
-        async with track_page_performance(page_num, url) as tracker:
-            last_structured_error = None
-
-            for attempt in range(retry_count + 1):  # +1 for initial attempt
-                try:
-                    # Use semaphore-controlled execution
-                    async def fetch_operation():
-                        context = await browser_manager.get_context()
-                        page = None
-                        try:
-                            page = await context.new_page()
-
-                            # Navigate to page with timeout
-                            await page.goto(url, timeout=120000)
-                            await page.wait_for_load_state("networkidle")
-
-                            # Extract ads from page
-                            results = await get_ads(page)
-                            tracker.set_results_count(len(results))
-
-                            # Add success metrics to error context
-                            if len(results) == 0:
-                                error_ctx.add_warning(
-                                    f"No results found on page {page_num}",
-                                    ErrorSeverity.LOW,
-                                    affected_items=[f"page_{page_num}"],
-                                    impact_description="Empty page may indicate end of results or filtering issues",
+    started_at = time.perf_counter()
+    try:
+        with error_handling_context(
+            operation="fetch_page", page_number=page_num, url=url, logger=logger
+        ) as error_ctx:
+            async with track_page_performance(page_num, url) as tracker:
+                last_structured_error = None
+
+                for attempt in range(retry_count + 1):  # +1 for initial attempt
+                    try:
+                        # Use semaphore-controlled execution
+                        async def fetch_operation():
+                            owns_context = context is None
+                            page_context = (
+                                await browser_manager.get_context()
+                                if owns_context
+                                else context
+                            )
+                            page = None
+                            try:
+                                page = await page_context.new_page()
+
+                                # Navigate and wait only for the listing DOM; trackers
+                                # and beacons keep the network busy long after it
+                                await page.route("**/*", block_heavy_resources)
+                                await page.goto(
+                                    url, timeout=120000, wait_until="domcontentloaded"
                                 )
+                                try:
+                                    await page.wait_for_selector(
+                                        LISTING_ARTICLE_SELECTOR,
+                                        state="attached",
+                                        timeout=15000,
+                                    )
+                                except PlaywrightTimeoutError:
+                                    # Empty result pages have no listings to wait for
+                                    pass
+
+                                # Extract ads from page
+                                results = await get_ads(page)
+                                tracker.set_results_count(len(results))
+                                if results:
+                                    # Later contexts start with the accepted cookies
+                                    await browser_manager.save_storage_state(page_context)
+
+                                # Add success metrics to error context
+                                if len(results) == 0:
+                                    error_ctx.add_warning(
+                                        f"No results found on page {page_num}",
+                                        ErrorSeverity.LOW,
+                                        affected_items=[f"page_{page_num}"],
+                                        impact_description="Empty page may indicate end of results or filtering issues",
+                                    )
+
+                                return results
+
+                            finally:
+                                if page:
+                                    await page.close()
+                                if owns_context:
+                                    await browser_manager.release_context(page_context)
+
+                        # Execute with concurrency control
+                        results = await browser_manager.execute_with_semaphore(
+                            fetch_operation()
+                        )
+                        tracker.set_retry_count(attempt)
+
+                        # Create enhanced metrics with error categorization
+                        metrics = tracker.get_metrics()
+                        if error_ctx.has_warnings():
+                            metrics.warning_count = len(error_ctx.warnings.get_warnings())
+
+                        return results, metrics
+
+                    except Exception as e:
+                        # Classify and handle the error
+                        error_ctx.context.retry_attempt = attempt
+                        structured_error = error_ctx.handle_exception(e, "page_fetch")
+                        last_structured_error = structured_error
+
+                        tracker.set_retry_count(attempt)
+
+                        # Check if we should retry based on error classification
+                        if attempt < retry_count and structured_error.should_retry(
+                            retry_count
+                        ):
+                            # Exponential backoff with jitter
+                            wait_time = retry_delay(attempt)
+
+                            # Add warning about retry attempt
+                            error_ctx.add_warning(
+                                f"Retrying page {page_num} after {structured_error.category.value} error (attempt {attempt + 1}/{retry_count + 1})",
+                                ErrorSeverity.MEDIUM,
+                                affected_items=[f"page_{page_num}"],
+                                impact_description=f"Temporary delay of {wait_time:.1f}s before retry",
+                            )
 
-                            return results
-
-                        finally:
-                            if page:
-                                await page.close()
-                            await browser_manager.release_context(context)
+                            await asyncio.sleep(wait_time)
+                            continue
 
-                    # Execute with concurrency control
-                    results = await browser_manager.execute_with_semaphore(
-                        fetch_operation()
-                    )
-                    tracker.set_retry_count(attempt)
+                        # All retries exhausted or non-recoverable error
+                        error_msg = f"Failed after {attempt + 1} attempts: {structured_error.message}"
+                        tracker.set_error(error_msg)
 
-                    # Create enhanced metrics with error categorization
-                    metrics = tracker.get_metrics()
-                    if error_ctx.has_warnings():
+                        # Create enhanced metrics with error information
+                        metrics = tracker.get_metrics()
+                        metrics.error_category = structured_error.category.value
                         metrics.warning_count = len(error_ctx.warnings.get_warnings())
 
-                    return results, metrics
-
-                except Exception as e:
-                    # Classify and handle the error
-                    error_ctx.context.retry_attempt = attempt
-                    structured_error = error_ctx.handle_exception(e, "page_fetch")
-                    last_structured_error = structured_error
-
-                    tracker.set_retry_count(attempt)
-
-                    # Check if we should retry based on error classification
-                    if attempt < retry_count and structured_error.should_retry(
-                        retry_count
-                    ):
-                        # Exponential backoff with jitter
-                        wait_time = (2**attempt) + random.uniform(0, 1)
-
-                        # Add warning about retry attempt
-                        error_ctx.add_warning(
-                            f"Retrying page {page_num} after {structured_error.category.value} error (attempt {attempt + 1}/{retry_count + 1})",
-                            ErrorSeverity.MEDIUM,
-                            affected_items=[f"page_{page_num}"],
-                            impact_description=f"Temporary delay of {wait_time:.1f}s before retry",
-                        )
-
-                        await asyncio.sleep(wait_time)
-                        continue
-
-                    # All retries exhausted or non-recoverable error
-                    error_msg = f"Failed after {attempt + 1} attempts: {structured_error.message}"
-                    tracker.set_error(error_msg)
+                        return [], metrics
 
-                    # Create enhanced metrics with error information
-                    metrics = tracker.get_metrics()
-                    metrics.error_category = structured_error.category.value
-                    metrics.warning_count = len(error_ctx.warnings.get_warnings())
+                # This should never be reached, but just in case
+                fallback_error = "Unexpected error in retry loop"
+                if last_structured_error:
+                    fallback_error = f"Final error: {last_structured_error.message}"
 
-                    return [], metrics
+                tracker.set_error(fallback_error)
+                metrics = tracker.get_metrics()
+                if last_structured_error:
+                    metrics.error_category = last_structured_error.category.value
+                metrics.warning_count = len(error_ctx.warnings.get_warnings())
 
-            # This should never be reached, but just in case
-            fallback_error = "Unexpected error in retry loop"
-            if last_structured_error:
-                fallback_error = f"Final error: {last_structured_error.message}"
-
-            tracker.set_error(fallback_error)
-            metrics = tracker.get_metrics()
-            if last_structured_error:
-                metrics.error_category = last_structured_error.category.value
-            metrics.warning_count = len(error_ctx.warnings.get_warnings())
+                return [], metrics
+    except Exception as e:
+        # Never let a page failure escape: callers gather pages without
+        # return_exceptions and read the outcome from the metrics
+        structured_error = ErrorClassifier.classify_exception(
+            e,
+            ErrorContext(operation="fetch_page", page_number=page_num, url=url),
+            "page_fetch",
+        )
+        logger.log_error(structured_error)
+        return [], PageMetrics(
+            page_number=page_num,
+            url=url,
+            start_time=started_at,
+            end_time=time.perf_counter(),
+            success=False,
+            retry_count=0,
+            error_message=structured_error.message,
+            results_count=0,
+            error_category=structured_error.category.value,
+        )
 
-            return [], metrics
 
+@lru_cache(maxsize=256)
+def build_search_template(
+    query: Optional[str],
+    location: Optional[str],
+    radius: Optional[int],
+    min_price: Optional[int],
+    max_price: Optional[int],
+) -> tuple[str, str]:
+    """
+    Return the search URL split around the page number as (prefix, suffix).
 
-async def get_inserate_klaz(
-    browser_manager: PlaywrightManager,
-    query: str = None,
-    location: str = None,
-    radius: int = None,
-    min_price: int = None,
-    max_price: int = None,
-    page_count: int = 1,
-):
+    Scheduler jobs repeat the same search parameters on every run, so the
+    result is cached per parameter combination.
+    """
     base_url = "https://www.kleinanzeigen.de"
 
     # Build the price filter part of the path
@@ -302,10 +394,6 @@ async def get_inserate_klaz(
         max_price_str = str(max_price) if max_price is not None else ""
         price_path = f"/preis:{min_price_str}:{max_price_str}"
 
-    # Build the search path with price and page information
-    search_path = f"{price_path}/s-seite"
-    search_path += ":{page}"
-
     # Build query parameters as before
     params = {}
     if query:
@@ -315,21 +403,60 @@ async def get_inserate_klaz(
     if radius:
         params["radius"] = radius
 
-    # Construct the full URL and get it
-    search_url = base_url + search_path + ("?" + urlencode(params) if params else "")
+    prefix = f"{base_url}{price_path}/s-seite:"
+    suffix = "?" + urlencode(params) if params else ""
+    return prefix, suffix
+
+
+def _build_search_urls(
+    query: Optional[str],
+    location: Optional[str],
+    radius: Optional[int],
+    min_price: Optional[int],
+    max_price: Optional[int],
+    page_count: int,
+) -> list[str]:
+    """Return the search result URLs for pages 1..page_count."""
+    prefix, suffix = build_search_template(
+        query, location, radius, min_price, max_price
+    )
+    return [f"{prefix}{i}{suffix}" for i in range(1, page_count + 1)]
+
+
+async def get_inserate_klaz(
+    browser_manager: PlaywrightManager,
+    query: str = None,
+    location: str = None,
+    radius: int = None,
+    min_price: int = None,
+    max_price: int = None,
+    page_count: int = 1,
+):
+    urls = _build_search_urls(
+        query, location, radius, min_price, max_price, page_count
+    )
+
+    # Cap concurrently open pages so large page counts don't exhaust the browser
+    page_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+    # All pages of one scrape are opened in a single browser context
+    context = await browser_manager.get_context()
 
-    tasks = []
-    for i in range(1, page_count + 1):
-        url = search_url.format(page=i)
-        tasks.append(fetch_page(browser_manager, url))
+    async def guarded_fetch(url: str):
+        async with page_semaphore:
+            return await fetch_page(browser_manager, url, context=context)
+
+    tasks = [guarded_fetch(url) for url in urls]
 
     try:
         results_from_pages = await asyncio.gather(*tasks)
         # Flatten the list of lists into a single list
-        all_results = [item for sublist in results_from_pages for item in sublist]
+        all_results = list(chain.from_iterable(results_from_pages))
         return all_results
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        await browser_manager.release_context(context)
 
 
 async def get_inserate_klaz_optimized(
@@ -367,46 +494,32 @@ async def get_inserate_klaz_optimized(
     with error_handling_context(
         operation="multi_page_scrape", logger=logger
     ) as error_ctx:
-        base_url = "https://www.kleinanzeigen.de"
-
-        # Build the price filter part of the path
-        price_path = ""
-        if min_price is not None or max_price is not None:
-            # Convert prices to strings; if one is None, leave its place empty
-            min_price_str = str(min_price) if min_price is not None else ""
-            max_price_str = str(max_price) if max_price is not None else ""
-            price_path = f"/preis:{min_price_str}:{max_price_str}"
-
-        # Build the search path with price and page information
-        search_path = f"{price_path}/s-seite"
-        search_path += ":{page}"
-
-        # Build query parameters as before
-        params = {}
-        if query:
-            params["keywords"] = query
-        if location:
-            params["locationStr"] = location
-        if radius:
-            params["radius"] = radius
-
-        # Construct the full URL and get it
-        search_url = (
-            base_url + search_path + ("?" + urlencode(params) if params else "")
+        urls = _build_search_urls(
+            query, location, radius, min_price, max_price, page_count
         )
 
-        # Create tasks for concurrent processing
-        tasks = []
-        for i in range(1, page_count + 1):
-            url = search_url.format(page=i)
-            tasks.append(optimized_fetch_page(browser_manager, url, i, logger=logger))
+        # Create tasks for concurrent processing; every page of the scrape is
+        # opened in one shared browser context
+        context = await browser_manager.get_context()
+        tasks = [
+            optimized_fetch_page(
+                browser_manager, url, page_num, logger=logger, context=context
+            )
+            for page_num, url in enumerate(urls, start=1)
+        ]
 
         # Set concurrent level for metrics
-        tracker.set_concurrent_level(min(page_count, browser_manager._semaphore._value))
+        tracker.set_concurrent_level(
+            min(page_count, browser_manager.semaphore_capacity)
+        )
 
         try:
-            # Execute all tasks concurrently with controlled concurrency
-            results_and_metrics = await asyncio.gather(*tasks, return_exceptions=True)
+            # Execute all tasks concurrently with controlled concurrency;
+            # optimized_fetch_page reports failures in its metrics and never raises
+            try:
+                results_and_metrics = await asyncio.gather(*tasks)
+            finally:
+                await browser_manager.release_context(context)
 
             # Process results and collect comprehensive metrics
             all_results = []
@@ -414,85 +527,45 @@ async def get_inserate_klaz_optimized(
             failed_pages = 0
             total_warnings = 0
 
-            for i, result in enumerate(results_and_metrics):
-                if isinstance(result, Exception):
-                    # Handle exceptions that weren't caught by optimized_fetch_page
-                    failed_pages += 1
+            for page_results, page_metrics in results_and_metrics:
+                tracker.add_page_metric(page_metrics)
 
-                    # Classify the exception
-                    error_context = ErrorContext(
-                        operation="page_fetch_gather",
-                        page_number=i + 1,
-                        url=search_url.format(page=i + 1),
-                    )
-                    structured_error = ErrorClassifier.classify_exception(
-                        result, error_context, "concurrent_page_fetch"
-                    )
+                if page_metrics.success:
+                    all_results.extend(page_results)
+                    successful_pages += 1
 
-                    # Add to warning manager
-                    warning_manager.add_error_as_warning(
-                        structured_error,
-                        affected_items=[f"page_{i + 1}"],
-                        impact_description=f"Page {i + 1} results unavailable due to {structured_error.category.value} error",
-                    )
-
-                    # Log the error
-                    logger.log_error(structured_error)
-
-                    # Create a failed page metric with enhanced information
-                    failed_metric = PageMetrics(
-                        page_number=i + 1,
-                        url=search_url.format(page=i + 1),
-                        start_time=time.time(),
-                        end_time=time.time(),
-                        success=False,
-                        retry_count=0,
-                        error_message=structured_error.message,
-                        results_count=0,
-                        error_category=structured_error.category.value,
-                    )
-                    tracker.add_page_metric(failed_metric)
-                else:
-                    # Unpack results and metrics
-                    page_results, page_metrics = result
-                    tracker.add_page_metric(page_metrics)
-
-                    if page_metrics.success:
-                        all_results.extend(page_results)
-                        successful_pages += 1
-
-                        # Check for potential issues even in successful pages
-                        if page_metrics.retry_count > 0:
-                            warning_manager.add_warning(
-                                f"Page {page_metrics.page_number} succeeded after {page_metrics.retry_count} retries",
-                                ErrorSeverity.LOW,
-                                error_ctx.context,
-                                affected_items=[f"page_{page_metrics.page_number}"],
-                                impact_description="Temporary network or server issues resolved",
-                            )
+                    # Check for potential issues even in successful pages
+                    if page_metrics.retry_count > 0:
+                        warning_manager.add_warning(
+                            f"Page {page_metrics.page_number} succeeded after {page_metrics.retry_count} retries",
+                            ErrorSeverity.LOW,
+                            error_ctx.context,
+                            affected_items=[f"page_{page_metrics.page_number}"],
+                            impact_description="Temporary network or server issues resolved",
+                        )
 
-                        if page_metrics.results_count == 0:
-                            warning_manager.add_warning(
-                                f"Page {page_metrics.page_number} returned no results",
-                                ErrorSeverity.LOW,
-                                error_ctx.context,
-                                affected_items=[f"page_{page_metrics.page_number}"],
-                                impact_description="May indicate end of available results or overly restrictive filters",
-                            )
-                    else:
-                        failed_pages += 1
+                    if page_metrics.results_count == 0:
                         warning_manager.add_warning(
-                            f"Page {page_metrics.page_number} failed: {page_metrics.error_message}",
-                            ErrorSeverity.MEDIUM
-                            if page_metrics.error_category == "recoverable"
-                            else ErrorSeverity.HIGH,
+                            f"Page {page_metrics.page_number} returned no results",
+                            ErrorSeverity.LOW,
                             error_ctx.context,
                             affected_items=[f"page_{page_metrics.page_number}"],
-                            impact_description=f"Results from page {page_metrics.page_number} unavailable",
+                            impact_description="May indicate end of available results or overly restrictive filters",
                         )
+                else:
+                    failed_pages += 1
+                    warning_manager.add_warning(
+                        f"Page {page_metrics.page_number} failed: {page_metrics.error_message}",
+                        ErrorSeverity.MEDIUM
+                        if page_metrics.error_category == "recoverable"
+                        else ErrorSeverity.HIGH,
+                        error_ctx.context,
+                        affected_items=[f"page_{page_metrics.page_number}"],
+                        impact_description=f"Results from page {page_metrics.page_number} unavailable",
+                    )
 
-                    # Count warnings from individual page processing
-                    total_warnings += page_metrics.warning_count
+                # Count warnings from individual page processing
+                total_warnings += page_metrics.warning_count
 
             # Get browser performance metrics
             browser_metrics = browser_manager.get_performance_metrics()
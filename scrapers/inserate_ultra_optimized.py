@@ -8,13 +8,10 @@ the best possible performance for multi-page scraping operations.
 import asyncio
 import time
 import random
-import gc
-from urllib.parse import urlencode
+from itertools import chain
 from typing import List, Dict, Any, Tuple, Optional
 
-from fastapi import HTTPException
-
-from utils.browser import OptimizedPlaywrightManager
+from utils.browser import OptimizedPlaywrightManager, PagePool
 from utils.performance import PageMetrics, PerformanceTracker
 from utils.error_handling import (
     ErrorLogger,
@@ -30,9 +27,26 @@ from utils.asyncio_optimizations import (
     EventLoopOptimizer,
     monitor_slow_coroutines,
 )
-from scrapers.inserate import extract_listing_image_url
+from scrapers.inserate import (
+    EXTRACT_ADS_JS,
+    LISTING_ARTICLE_SELECTOR,
+    PRICE_NOISE_PATTERN,
+    build_search_template,
+    select_listing_image_url,
+)
 from utils.location_filter import filter_listings_by_radius
 
+# Whether the serving loop is uvloop; resolved on first use from inside the
+# running loop and then reused, since the loop policy is set once at startup
+_UVLOOP_ENABLED: Optional[bool] = None
+
+
+def _uvloop_enabled() -> bool:
+    global _UVLOOP_ENABLED
+    if _UVLOOP_ENABLED is None:
+        _UVLOOP_ENABLED = EventLoopOptimizer.uses_uvloop()
+    return _UVLOOP_ENABLED
+
 
 class UltraOptimizedScraper:
     """
@@ -40,7 +54,7 @@ class UltraOptimizedScraper:
 
     Features:
     - uvloop integration for 2-4x performance boost
-    - Memory-conscious processing with automatic GC
+    - Memory-conscious processing
     - Advanced task management with weak references
     - Connection pooling and reuse
     - Intelligent concurrency control
@@ -48,138 +62,63 @@ class UltraOptimizedScraper:
 
     def __init__(self, browser_manager: OptimizedPlaywrightManager):
         self.browser_manager = browser_manager
-        self.task_manager = HighPerformanceTaskManager(
-            max_concurrent=browser_manager._semaphore._value
-        )
+        max_concurrent = browser_manager.semaphore_capacity
+        self.task_manager = HighPerformanceTaskManager(max_concurrent=max_concurrent)
         self.memory_processor = MemoryOptimizedProcessor(
-            max_concurrent=browser_manager._semaphore._value,
+            max_concurrent=max_concurrent,
             gc_threshold=50,  # More frequent GC for memory efficiency
         )
 
-        # Setup uvloop if available
-        EventLoopOptimizer.setup_uvloop()
+    @property
+    def uvloop_enabled(self) -> bool:
+        """Whether the running event loop is uvloop (must be read inside it)."""
+        return _uvloop_enabled()
 
     @monitor_slow_coroutines(threshold=0.5)
     async def extract_ads_optimized(self, page) -> List[Dict[str, Any]]:
         """
         Optimized ad extraction with memory management.
 
-        Uses efficient DOM querying and immediate result processing
-        to minimize memory usage.
+        Harvests every listing field in a single locator.evaluate_all call and
+        finishes the rows in-process, so a results page costs one CDP
+        round-trip regardless of how many ads it holds. Errors propagate to
+        ultra_optimized_fetch_page, which classifies them and decides on a
+        retry.
         """
-        try:
-            # Use more specific selector to reduce DOM traversal
-            items = await page.query_selector_all(
-                ".ad-listitem:not(.is-topad):not(.badge-hint-pro-small-srp) article[data-adid]"
-            )
-
-            results = []
-
-            # Process items in batches to control memory usage
-            batch_size = 10
-            for i in range(0, len(items), batch_size):
-                batch = items[i : i + batch_size]
-
-                # Process batch concurrently
-                batch_tasks = []
-                for item in batch:
-                    batch_tasks.append(self._extract_single_ad(item))
-
-                batch_results = await asyncio.gather(
-                    *batch_tasks, return_exceptions=True
-                )
-
-                # Filter successful results
-                for result in batch_results:
-                    if isinstance(result, dict):
-                        results.append(result)
-
-                # Periodic memory cleanup
-                if i % (batch_size * 5) == 0:
-                    gc.collect()
-
-            return results
-
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
-
-    async def _extract_single_ad(self, article) -> Dict[str, Any]:
-        """Extract data from a single ad article element."""
-        try:
-            # Get basic attributes first (fastest operations)
-            data_adid = await article.get_attribute("data-adid")
-            data_href = await article.get_attribute("data-href")
-
-            if not data_adid or not data_href:
-                return None
-
-            # Parallel extraction of text content and image
-            title_task = self._get_text_content(
-                article, "h2.text-module-begin a.ellipsis"
-            )
-            price_task = self._get_text_content(
-                article, "p.aditem-main--middle--price-shipping--price"
-            )
-            desc_task = self._get_text_content(
-                article, "p.aditem-main--middle--description"
-            )
-            image_task = self._get_image_url(article)
+        rows = await page.locator(LISTING_ARTICLE_SELECTOR).evaluate_all(
+            EXTRACT_ADS_JS
+        )
 
-            title_text, price_text, description_text, image_url = await asyncio.gather(
-                title_task, price_task, desc_task, image_task, return_exceptions=True
+        results = []
+        for row in rows:
+            # The extractor returns null for articles without an id or link
+            if row is None:
+                continue
+
+            price_text = PRICE_NOISE_PATTERN.sub("", row["price"]).strip()
+
+            results.append(
+                {
+                    "adid": row["adid"],
+                    "url": f"https://www.kleinanzeigen.de{row['href']}",
+                    "title": row["title"],
+                    "price": price_text,
+                    "description": row["description"],
+                    "image": select_listing_image_url(row),
+                }
             )
 
-            # Process price text efficiently
-            if isinstance(price_text, str):
-                price_text = (
-                    price_text.replace("€", "")
-                    .replace("VB", "")
-                    .replace(".", "")
-                    .strip()
-                )
-            else:
-                price_text = ""
-
-            return {
-                "adid": data_adid,
-                "url": f"https://www.kleinanzeigen.de{data_href}",
-                "title": title_text if isinstance(title_text, str) else "",
-                "price": price_text,
-                "description": description_text
-                if isinstance(description_text, str)
-                else "",
-                "image": image_url if isinstance(image_url, str) else None,
-            }
-
-        except Exception:
-            return None
-
-    async def _get_text_content(self, parent_element, selector: str) -> str:
-        """Efficiently get text content from an element."""
-        try:
-            element = await parent_element.query_selector(selector)
-            if element:
-                return await element.inner_text()
-            return ""
-        except Exception:
-            return ""
-
-    async def _get_image_url(self, article) -> Optional[str]:
-        """Extract image URL from article element."""
-        try:
-            return await extract_listing_image_url(article)
-        except Exception:
-            return None
+        return results
 
     @monitor_slow_coroutines(threshold=2.0)
     async def ultra_optimized_fetch_page(
-        self, url: str, page_num: int, retry_count: int = 2
+        self, url: str, page_num: int, page_pool: PagePool, retry_count: int = 2
     ) -> Tuple[List[Dict], PageMetrics]:
         """
         Ultra-optimized page fetching with all performance enhancements.
 
         Features:
-        - Context reuse from pool
+        - Page reuse from the scrape's page pool
         - Intelligent retry with exponential backoff
         - Memory-conscious processing
         - Comprehensive error handling
@@ -193,13 +132,10 @@ class UltraOptimizedScraper:
             last_error = None
 
             for attempt in range(retry_count + 1):
-                context = None
                 page = None
 
                 try:
-                    # Get context from pool (optimized)
-                    context = await self.browser_manager.get_context()
-                    page = await context.new_page()
+                    page = await page_pool.acquire()
 
                     # Optimized page loading with minimal wait
                     await page.goto(url, timeout=60000, wait_until="domcontentloaded")
@@ -232,6 +168,11 @@ class UltraOptimizedScraper:
                 except Exception as e:
                     last_error = e
 
+                    # A page that failed mid-load is not worth reusing
+                    if page:
+                        await page_pool.discard(page)
+                        page = None
+
                     # Classify error for retry decision
                     error_context = ErrorContext(
                         operation="ultra_page_fetch",
@@ -257,11 +198,8 @@ class UltraOptimizedScraper:
                     break
 
                 finally:
-                    # Cleanup resources immediately
                     if page:
-                        await page.close()
-                    if context:
-                        await self.browser_manager.release_context(context)
+                        await page_pool.release(page)
 
             # Create failed metrics
             error_msg = str(last_error) if last_error else "Unknown error"
@@ -302,75 +240,68 @@ class UltraOptimizedScraper:
 
         with error_handling_context(operation="ultra_multi_page_scrape", logger=logger) as ctx:
             # Build URLs efficiently
-            base_url = "https://www.kleinanzeigen.de"
-
-            # Optimized URL building
-            price_path = ""
-            if min_price is not None or max_price is not None:
-                min_str = str(min_price) if min_price is not None else ""
-                max_str = str(max_price) if max_price is not None else ""
-                price_path = f"/preis:{min_str}:{max_str}"
-
-            search_path = f"{price_path}/s-seite:{{page}}"
-
-            params = {}
-            if query:
-                params["keywords"] = query
-            if location:
-                params["locationStr"] = location
-            if radius:
-                params["radius"] = radius
+            url_prefix, url_suffix = build_search_template(
+                query, location, radius, min_price, max_price
+            )
 
-            param_string = f"?{urlencode(params)}" if params else ""
-            search_url = base_url + search_path.format(price_path=price_path, page='{page}') + param_string
+            # Sliding window: a page starts as soon as any running page
+            # finishes, so one slow page never holds back a whole batch
+            concurrency = min(8, page_count)  # Optimal window based on testing
+            window = asyncio.Semaphore(concurrency)
 
-            # Create page fetch tasks
             async def create_page_task(page_num: int):
-                url = search_url.format(page=page_num)
-                return await self.ultra_optimized_fetch_page(url, page_num)
-
-            # Use memory-optimized batch processing
-            page_numbers = list(range(1, page_count + 1))
-
-            # Process in optimal batches to balance speed and memory
-            batch_size = min(8, page_count)  # Optimal batch size based on testing
-            all_results = []
-            all_metrics = []
-
-            for i in range(0, len(page_numbers), batch_size):
-                batch_pages = page_numbers[i : i + batch_size]
-
-                # Create tasks for this batch
-                batch_tasks = [create_page_task(page_num) for page_num in batch_pages]
+                url = f"{url_prefix}{page_num}{url_suffix}"
+                async with window:
+                    return await self.ultra_optimized_fetch_page(
+                        url, page_num, page_pool
+                    )
 
-                # Execute batch with task manager
-                batch_results = await self.task_manager.gather_with_limit(
-                    batch_tasks, return_exceptions=True
-                )
+            # Indexed by page number so results keep page order even though
+            # pages complete out of order
+            page_results_buckets: List[Optional[List[Dict]]] = [None] * page_count
+            page_metrics_slots: List[Optional[PageMetrics]] = [None] * page_count
+
+            # One context serves the whole scrape; its pages are reused
+            context = await self.browser_manager.get_context()
+            page_pool = PagePool(context)
+            try:
+                page_tasks = [
+                    self.task_manager.create_task(
+                        create_page_task(page_num), f"page_task_{page_num}"
+                    )
+                    for page_num in range(1, page_count + 1)
+                ]
 
-                # Process batch results
-                for result in batch_results:
-                    if isinstance(result, Exception):
+                # Aggregate pages as they complete
+                for next_page in asyncio.as_completed(page_tasks):
+                    try:
+                        page_results, page_metrics = await next_page
+                    except Exception as e:
                         # Handle unexpected exceptions
                         logger.log_error(
                             ErrorClassifier.classify_exception(
-                                result,
-                                ErrorContext(operation="batch_processing"),
-                                "batch_execution",
+                                e,
+                                ErrorContext(operation="page_task"),
+                                "page_execution",
                             )
                         )
                         continue
 
-                    page_results, page_metrics = result
-                    all_results.extend(page_results)
-                    all_metrics.append(page_metrics)
+                    slot = page_metrics.page_number - 1
+                    page_results_buckets[slot] = page_results
+                    page_metrics_slots[slot] = page_metrics
                     tracker.add_page_metric(page_metrics)
+            finally:
+                await page_pool.close()
+                await self.browser_manager.release_context(context)
 
-                # Memory cleanup between batches
-                gc.collect()
+            all_results = list(
+                chain.from_iterable(b for b in page_results_buckets if b)
+            )
+            all_metrics = [m for m in page_metrics_slots if m is not None]
 
             # Set performance metrics
-            tracker.set_concurrent_level(batch_size)
+            tracker.set_concurrent_level(concurrency)
             browser_metrics = self.browser_manager.get_performance_metrics()
             tracker.set_browser_contexts_used(
                 browser_metrics["contexts_in_use"] + browser_metrics["contexts_in_pool"]
@@ -460,7 +391,7 @@ class UltraOptimizedScraper:
                     "success_rate": round(success_rate, 2),
                     "optimization_level": "ultra",
                     "memory_optimized": True,
-                    "uvloop_enabled": hasattr(asyncio.get_event_loop(), "_selector"),
+                    "uvloop_enabled": self.uvloop_enabled,
                 },
                 "task_metrics": task_metrics,
                 "browser_metrics": browser_metrics,
@@ -468,9 +399,8 @@ class UltraOptimizedScraper:
                     "uvloop_integration",
                     "memory_conscious_processing",
                     "advanced_task_management",
-                    "intelligent_batching",
+                    "sliding_window_scheduling",
                     "context_pooling",
-                    "automatic_gc",
                 ],
             }
 
@@ -490,7 +420,6 @@ class UltraOptimizedScraper:
         """Clean up all resources."""
         await self.task_manager.cancel_all()
         await self.memory_processor.cleanup()
-        gc.collect()
 
 
 # Factory function for easy integration
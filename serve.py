@@ -1,16 +1,18 @@
 import logging
+import multiprocessing
 import os
-import threading
 
 import uvicorn
 
-from main import app as api_app
-from mcp_server import create_mcp_server
-
 
 def _start_mcp_server() -> None:
+    # Runs in a spawned child process, so logging and the server are set up
+    # here rather than inherited from the API process.
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
     logger = logging.getLogger(__name__)
     try:
+        from mcp_server import create_mcp_server
+
         server = create_mcp_server()
         logger.info("Starting MCP server on %s:%s", server.settings.host, server.settings.port)
         server.run("streamable-http")
@@ -21,17 +23,32 @@ def _start_mcp_server() -> None:
 def main() -> None:
     logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
 
-    mcp_thread = threading.Thread(target=_start_mcp_server, daemon=True, name="mcp-server")
-    mcp_thread.start()
+    # Separate process so the MCP server does not share a GIL with the API;
+    # spawn keeps the child from inheriting the parent's interpreter state.
+    mcp_process = multiprocessing.get_context("spawn").Process(
+        target=_start_mcp_server, daemon=True, name="mcp-server"
+    )
+    mcp_process.start()
+
+    from main import app as api_app
 
     api_host = os.getenv("API_HOST", "0.0.0.0")
     api_port = int(os.getenv("API_PORT", "8000"))
     try:
-        uvicorn.run(api_app, host=api_host, port=api_port, log_level=os.getenv("UVICORN_LOG_LEVEL", "info"))
+        # The loop must be chosen before uvicorn creates it; switching the
+        # policy from inside the app is too late to take effect.
+        uvicorn.run(
+            api_app,
+            host=api_host,
+            port=api_port,
+            loop="uvloop",
+            log_level=os.getenv("UVICORN_LOG_LEVEL", "info"),
+        )
     finally:
-        if mcp_thread.is_alive():
-            logging.getLogger(__name__).info("Waiting for MCP server thread to exit")
-            mcp_thread.join(timeout=5)
+        if mcp_process.is_alive():
+            logging.getLogger(__name__).info("Stopping MCP server process")
+            mcp_process.terminate()
+            mcp_process.join(timeout=5)
 
 
 if __name__ == "__main__":
@@ -3,92 +3,182 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 from collections import defaultdict
-from typing import Awaitable, Callable, Dict, List, Type, TypeVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from loguru import logger
 
 EventT = TypeVar("EventT")
 EventHandler = Callable[[EventT], Awaitable[None]]
+SyncEventHandler = Callable[[EventT], None]
 
 
 class EventBus:
-    """Lightweight asynchronous event bus with a single dispatcher task."""
-
-    def __init__(self) -> None:
-        self._queue: asyncio.Queue[object] = asyncio.Queue()
-        self._subscribers: Dict[Type[object], List[EventHandler]] = defaultdict(list)
-        self._dispatcher: asyncio.Task | None = None
-        self._running = asyncio.Event()
-
-    def subscribe(self, event_type: Type[EventT], handler: EventHandler[EventT]) -> None:
-        """Register an asynchronous handler for the given event type."""
-
-        self._subscribers[event_type].append(handler)  # type: ignore[arg-type]
+    """Lightweight asynchronous event bus that fans out events as they are published."""
+
+    def __init__(self, shutdown_timeout: float = 5.0) -> None:
+        # Handlers are stored as tuples and replaced on subscribe(), so readers
+        # never need a defensive copy.
+        self._subscribers: Dict[Type[object], Tuple[EventHandler, ...]] = defaultdict(tuple)
+        self._sync_subscribers: Dict[Type[object], Tuple[SyncEventHandler, ...]] = (
+            defaultdict(tuple)
+        )
+        # Flattened (sync, async) handlers per concrete event type, including
+        # those registered for base classes; rebuilt lazily after every subscribe().
+        self._dispatch_cache: Dict[
+            Type[object], Tuple[Tuple[SyncEventHandler, ...], Tuple[EventHandler, ...]]
+        ] = {}
+        self._pending: Set[asyncio.Task] = set()
+        self._shutdown_timeout = shutdown_timeout
+        self._stopped = False
+
+    def subscribe(
+        self,
+        event_type: Type[EventT],
+        handler: Union[EventHandler[EventT], SyncEventHandler[EventT]],
+    ) -> None:
+        """Register a handler for the given event type.
+
+        Coroutine handlers run in a background task; other callables are called
+        inline on publish and must not block. If one of them returns an
+        awaitable (e.g. a lambda or functools.partial wrapping a coroutine
+        function), that awaitable is awaited in the background as well.
+        """
+
+        if not callable(handler):
+            raise TypeError(f"Event handler must be callable, got {handler!r}")
+        if inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(
+            type(handler).__call__
+        ):
+            self._subscribers[event_type] += (handler,)  # type: ignore[operator]
+        else:
+            self._sync_subscribers[event_type] += (handler,)  # type: ignore[operator]
+        self._dispatch_cache.clear()
 
     async def start(self) -> None:
-        """Start the dispatcher loop if not already running."""
+        """Accept published events again after a previous stop().
 
-        if self._dispatcher is not None and not self._dispatcher.done():
-            return
+        There is no dispatcher task to launch: events published before start()
+        are already delivered, and each publish() fans out on its own, so
+        handlers for consecutive events may run concurrently rather than one
+        event after another.
+        """
 
-        self._running.set()
-        self._dispatcher = asyncio.create_task(self._dispatch_loop())
+        self._stopped = False
 
     async def stop(self) -> None:
-        """Stop the dispatcher loop and wait for graceful shutdown."""
+        """Stop accepting events and let in-flight handlers finish or cancel them."""
 
-        if self._dispatcher is None:
+        self._stopped = True
+        if not self._pending:
             return
 
-        self._running.clear()
-        await self._queue.put(None)  # Sentinel to unblock queue
-
-        try:
-            await self._dispatcher
-        except asyncio.CancelledError:
-            pass
-        finally:
-            self._dispatcher = None
+        _, still_running = await asyncio.wait(
+            set(self._pending), timeout=self._shutdown_timeout
+        )
+        for task in still_running:
+            task.cancel()
+        if still_running:
+            await asyncio.gather(*still_running, return_exceptions=True)
 
     async def publish(self, event: object) -> None:
-        """Enqueue an event for asynchronous fan-out."""
-
-        await self._queue.put(event)
-
-    async def _dispatch_loop(self) -> None:
-        while self._running.is_set():
-            event = await self._queue.get()
-            if event is None:
-                # Sentinel - allow graceful exit
-                self._queue.task_done()
-                break
-
-            handlers = list(self._subscribers.get(type(event), []))
-            if not handlers:
-                logger.debug("No subscribers for event", event_type=type(event).__name__)
-                self._queue.task_done()
-                continue
+        """Schedule fan-out of an event to its subscribers without waiting for them."""
 
-            await self._fan_out(event, handlers)
-            self._queue.task_done()
+        if self._stopped:
+            logger.debug("Event bus stopped, dropping event", event_type=type(event).__name__)
+            return
 
-    async def _fan_out(self, event: object, handlers: List[EventHandler]) -> None:
-        tasks = []
-        for handler in handlers:
-            tasks.append(asyncio.create_task(self._invoke_handler(handler, event)))
+        sync_handlers, handlers = self._handlers_for(type(event))
+        if not sync_handlers and not handlers:
+            logger.debug("No subscribers for event", event_type=type(event).__name__)
+            return
+
+        pending_results: List[Tuple[SyncEventHandler, Awaitable[Any]]] = []
+        for sync_handler in sync_handlers:
+            try:
+                result = sync_handler(event)
+            except Exception:
+                logger.exception(
+                    "Event handler failed",
+                    handler=getattr(sync_handler, "__name__", repr(sync_handler)),
+                    event_type=type(event).__name__,
+                )
+                continue
+            if inspect.isawaitable(result):
+                pending_results.append((sync_handler, result))
 
-        if not tasks:
+        if not handlers and not pending_results:
             return
 
-        try:
-            await asyncio.gather(*tasks, return_exceptions=False)
-        except Exception:
-            logger.exception("Event handler raised exception", event_type=type(event).__name__)
+        # Keep a strong reference until the fan-out finishes; the loop itself
+        # only holds weak references to tasks.
+        task = asyncio.create_task(self._fan_out(event, handlers, pending_results))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def _handlers_for(
+        self, event_type: Type[object]
+    ) -> Tuple[Tuple[SyncEventHandler, ...], Tuple[EventHandler, ...]]:
+        handlers = self._dispatch_cache.get(event_type)
+        if handlers is None:
+            handlers = (
+                tuple(
+                    handler
+                    for cls in event_type.__mro__
+                    for handler in self._sync_subscribers.get(cls, ())
+                ),
+                tuple(
+                    handler
+                    for cls in event_type.__mro__
+                    for handler in self._subscribers.get(cls, ())
+                ),
+            )
+            self._dispatch_cache[event_type] = handlers
+        return handlers
+
+    async def _fan_out(
+        self,
+        event: object,
+        handlers: Tuple[EventHandler, ...],
+        pending_results: List[Tuple[SyncEventHandler, Awaitable[Any]]],
+    ) -> None:
+        invocations = [self._invoke_handler(handler, event) for handler in handlers]
+        invocations.extend(
+            self._invoke_handler(handler, event, result) for handler, result in pending_results
+        )
+
+        # Most event types have a single subscriber; skip the task group for it
+        if len(invocations) == 1:
+            await invocations[0]
+            return
 
-    async def _invoke_handler(self, handler: EventHandler, event: object) -> None:
+        # _invoke_handler logs and swallows handler errors, so the group never
+        # cancels siblings because of a failing handler.
+        async with asyncio.TaskGroup() as group:
+            for invocation in invocations:
+                group.create_task(invocation)
+
+    async def _invoke_handler(
+        self,
+        handler: Union[EventHandler, SyncEventHandler],
+        event: object,
+        result: Optional[Awaitable[Any]] = None,
+    ) -> None:
         try:
-            await handler(event)  # type: ignore[arg-type]
+            await (result if result is not None else handler(event))  # type: ignore[misc]
         except Exception:
             logger.exception(
                 "Event handler failed",
@@ -3,19 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import io
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import httpx
-import imagehash
 import numpy as np
 from loguru import logger
 from PIL import Image, UnidentifiedImageError
 from prometheus_client import Counter, Histogram
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from db.models import ImageFingerprint, Listing
@@ -35,6 +38,70 @@ IMAGE_ANALYSIS_COUNTER = Counter(
     labelnames=["status"],
 )
 
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+HASH_BIT_LENGTH = 64  # phash outputs 64-bit hashes
+PHASH_SIZE = 8
+# Fingerprint rows pulled from the database per popcount batch
+CANDIDATE_BATCH_SIZE = 4096
+# phash only looks at a 32x32 downscale (hash_size 8 x highfreq_factor 4)
+PHASH_INPUT_SIZE = (32, 32)
+
+# Low-frequency rows of an unnormalised DCT-II basis over the phash input. The
+# usual factor of 2 is dropped: the hash only compares coefficients against
+# their median, so a positive scale does not change it.
+_PHASH_DCT = np.cos(
+    np.pi
+    * np.arange(PHASH_SIZE)[:, None]
+    * (2 * np.arange(PHASH_INPUT_SIZE[0])[None, :] + 1)
+    / (2 * PHASH_INPUT_SIZE[0])
+).astype(np.float32)
+
+
+def _split_hash_bands(threshold: int) -> List[Tuple[int, int]]:
+    """Split a hash into ``threshold + 1`` contiguous bands as ``(shift, mask)``.
+
+    Two hashes within ``threshold`` bits of each other differ in at most
+    ``threshold`` bands, so by the pigeonhole principle they agree exactly in
+    at least one of them.
+    """
+
+    count = max(1, min(threshold + 1, HASH_BIT_LENGTH))
+    width, wider = divmod(HASH_BIT_LENGTH, count)
+    bands: List[Tuple[int, int]] = []
+    shift = HASH_BIT_LENGTH
+    for index in range(count):
+        band_width = width + (1 if index < wider else 0)
+        shift -= band_width
+        bands.append((shift, (1 << band_width) - 1))
+    return bands
+
+
+def _to_bigint(value: int) -> int:
+    """Reinterpret an unsigned 64-bit value as the two's complement a BIGINT holds.
+
+    Half of all hashes have the top bit set and would overflow the signed
+    ``hash_bits`` column as plain integers; the same encoding is applied to
+    band masks and values so SQL bit operations still line up.
+    """
+
+    return value - (1 << HASH_BIT_LENGTH) if value >> (HASH_BIT_LENGTH - 1) else value
+
+
+def _phash_bits(image: Image.Image) -> int:
+    """Return the perceptual hash of an image as a 64-bit integer.
+
+    Same algorithm as ``imagehash.phash``, but the DCT runs in float32 and only
+    the 8x8 low-frequency block the hash keeps is computed.
+    """
+
+    grayscale = image.convert("L").resize(PHASH_INPUT_SIZE, Image.Resampling.LANCZOS)
+    pixels = np.asarray(grayscale, dtype=np.float32)
+    low_freq = _PHASH_DCT @ pixels @ _PHASH_DCT.T
+    bits = low_freq > np.median(low_freq)
+    # packbits is MSB-first, matching the row-major bit order of imagehash
+    return int.from_bytes(np.packbits(bits.reshape(-1)).tobytes(), "big")
+
 
 @dataclass(slots=True)
 class AnalysisConfig:
@@ -45,6 +112,8 @@ class AnalysisConfig:
     fetch_timeout_seconds: float = 15.0
     max_image_bytes: int = 10_000_000  # 10 MB safeguard
     parallel_downloads: int = 3
+    keepalive_expiry_seconds: float = 30.0
+    hash_cache_size: int = 8192
 
 
 class ImageAnalysisService:
@@ -64,6 +133,11 @@ class ImageAnalysisService:
         self._queue: asyncio.Queue[ListingImagesUpdated] = asyncio.Queue()
         self._worker_task: asyncio.Task | None = None
         self._http_client: httpx.AsyncClient | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        # Content digest -> (hash_bits, width, height) for recently hashed images.
+        # Fingerprints are built on executor threads, hence the lock.
+        self._hash_cache: OrderedDict[bytes, Tuple[int, int, int]] = OrderedDict()
+        self._hash_cache_lock = threading.Lock()
         self._started = False
         self._image_fetcher = image_fetcher
 
@@ -74,7 +148,20 @@ class ImageAnalysisService:
             return
 
         self._started = True
-        self._http_client = httpx.AsyncClient(timeout=self._config.fetch_timeout_seconds)
+        self._http_client = httpx.AsyncClient(
+            timeout=self._config.fetch_timeout_seconds,
+            # Listing images come from one CDN host; keep its connections warm
+            limits=httpx.Limits(
+                max_connections=self._config.parallel_downloads,
+                max_keepalive_connections=self._config.parallel_downloads,
+                keepalive_expiry=self._config.keepalive_expiry_seconds,
+            ),
+            follow_redirects=True,
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._config.parallel_downloads,
+            thread_name_prefix="image-analysis",
+        )
         self._worker_task = asyncio.create_task(self._process_events())
         logger.info("ImageAnalysisService started")
 
@@ -90,6 +177,9 @@ class ImageAnalysisService:
         if self._http_client:
             await self._http_client.aclose()
             self._http_client = None
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
         logger.info("ImageAnalysisService stopped")
 
     async def _enqueue_event(self, event: ListingImagesUpdated) -> None:
@@ -140,49 +230,81 @@ class ImageAnalysisService:
                 )
                 return
 
-            if not event.image_urls:
-                await repo.clear_suspicion(listing)
-                await session.commit()
-                await self._event_bus.publish(
-                    ListingAnalysisCompleted(
-                        listing_id=listing.id,
-                        external_id=listing.external_id,
-                        is_suspicious=False,
-                        reason=None,
-                        confidence=None,
-                        meta=None,
-                    )
-                )
-                logger.debug(
-                    "Cleared suspicion for listing without images",
-                    listing_id=event.listing_id,
-                )
-                return
-
             fingerprint_repo = ImageFingerprintRepository(session)
-            await fingerprint_repo.delete_for_listing(listing.id)
 
-            existing_fingerprints = await fingerprint_repo.list_all(
-                exclude_listing=listing.id
-            )
+            # Re-scrapes mostly report the same images; keep their stored
+            # fingerprints and only hash URLs that are new to this listing
+            wanted_urls = dict.fromkeys(event.image_urls)
+            kept_fingerprints: Dict[str, ImageFingerprint] = {}
+            stale_ids: List[int] = []
+            for stored in await fingerprint_repo.list_by_listing(listing.id):
+                if (
+                    stored.image_url in wanted_urls
+                    and stored.hash_method == self._config.hash_method
+                    and stored.image_url not in kept_fingerprints
+                ):
+                    kept_fingerprints[stored.image_url] = stored
+                else:
+                    stale_ids.append(stored.id)
+            if stale_ids:
+                await fingerprint_repo.delete_by_ids(stale_ids)
+
+            now = datetime.now(timezone.utc)
+            new_fingerprints = [
+                fingerprint
+                async for fingerprint in self._compute_fingerprints(
+                    listing.id,
+                    [url for url in wanted_urls if url not in kept_fingerprints],
+                    now,
+                )
+            ]
+            fingerprints = [*kept_fingerprints.values(), *new_fingerprints]
+
+            # Only rows sharing an exact band with a new hash can be within the
+            # threshold, so the rest never leave the database. Candidates are
+            # streamed as bare hash columns in batches; only hits become ORM rows.
+            hits: List[Tuple[int, int]] = []
+            if fingerprints:
+                query_bits = np.fromiter(
+                    (self._fingerprint_bits(fingerprint) for fingerprint in fingerprints),
+                    dtype=np.uint64,
+                    count=len(fingerprints),
+                )
+                async for rows in fingerprint_repo.stream_band_candidate_hashes(
+                    hash_method=self._config.hash_method,
+                    bands=self._band_filters(fingerprints),
+                    exclude_listing=listing.id,
+                    batch_size=CANDIDATE_BATCH_SIZE,
+                ):
+                    self._collect_similarity_hits(query_bits, rows, hits)
 
             match_candidates: List[Tuple[ImageFingerprint, int]] = []
-
-            async for fingerprint in self._compute_fingerprints(listing.id, event.image_urls):
-                self._update_similarity_matches(
-                    fingerprint, existing_fingerprints, match_candidates
-                )
-                session.add(fingerprint)
+            if hits:
+                hit_fingerprints = {
+                    fingerprint.id: fingerprint
+                    for fingerprint in await fingerprint_repo.list_by_ids(
+                        {fingerprint_id for fingerprint_id, _ in hits}
+                    )
+                }
+                match_candidates = [
+                    (hit_fingerprints[fingerprint_id], diff)
+                    for fingerprint_id, diff in hits
+                    if fingerprint_id in hit_fingerprints
+                ]
+            session.add_all(new_fingerprints)
 
             await session.flush()
 
             matched_listing_ids = {fingerprint.listing_id for fingerprint, _ in match_candidates}
-            matched_listings: Dict[int, Listing] = {}
+            # Only the columns the payload and the propagated meta need; full
+            # rows would drag descriptions and other JSON along for nothing
+            matched_listings: Dict[int, Row] = {}
             if matched_listing_ids:
-                stmt = select(Listing).where(Listing.id.in_(matched_listing_ids))
+                stmt = select(
+                    Listing.id, Listing.external_id, Listing.suspicion_meta
+                ).where(Listing.id.in_(matched_listing_ids))
                 result = await session.execute(stmt)
-                matched_list = result.scalars().all()
-                matched_listings = {item.id: item for item in matched_list}
+                matched_listings = {row.id: row for row in result}
 
             matches_payload = [
                 {
@@ -242,22 +364,60 @@ class ImageAnalysisService:
         self,
         listing_id: int,
         image_urls: Sequence[str],
+        now: datetime,
     ) -> AsyncIterator[ImageFingerprint]:
-        semaphore = asyncio.Semaphore(self._config.parallel_downloads)
-
-        async def process(url: str) -> Optional[ImageFingerprint]:
-            async with semaphore:
-                image_bytes = await self._fetch_image(url)
-                if image_bytes is None:
-                    return None
+        urls = list(dict.fromkeys(image_urls))
+        if not urls:
+            return
 
-                return self._build_fingerprint(listing_id, url, image_bytes)
+        # Downloads release their slot as soon as the bytes are in, and hand
+        # them to decode workers through a bounded queue: the network keeps
+        # the next image in flight while the previous one is hashed, and a
+        # slow decoder stalls downloads instead of piling up image bytes
+        workers = self._config.parallel_downloads
+        semaphore = asyncio.Semaphore(workers)
+        downloaded: asyncio.Queue[Tuple[str, bytes]] = asyncio.Queue(maxsize=workers)
+        finished: asyncio.Queue[ImageFingerprint | BaseException | None] = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+
+        async def download(url: str) -> None:
+            try:
+                async with semaphore:
+                    image_bytes = await self._fetch_image(url)
+            except Exception as exc:
+                finished.put_nowait(exc)
+                return
+            if image_bytes is None:
+                finished.put_nowait(None)
+            else:
+                await downloaded.put((url, image_bytes))
+
+        async def decode() -> None:
+            while True:
+                url, image_bytes = await downloaded.get()
+                try:
+                    # Pillow releases the GIL while decoding, so hashing in a
+                    # thread keeps the event loop free for downloads and DB work
+                    result = await loop.run_in_executor(
+                        self._executor, self._build_fingerprint, listing_id, url, image_bytes, now
+                    )
+                except Exception as exc:
+                    result = exc
+                finished.put_nowait(result)
 
-        tasks = [asyncio.create_task(process(url)) for url in image_urls]
-        for task in asyncio.as_completed(tasks):
-            fingerprint = await task
-            if fingerprint is not None:
-                yield fingerprint
+        tasks = [asyncio.create_task(download(url)) for url in urls]
+        tasks.extend(asyncio.create_task(decode()) for _ in range(min(workers, len(urls))))
+        try:
+            for _ in urls:
+                result = await finished.get()
+                if isinstance(result, BaseException):
+                    raise result
+                if result is not None:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _fetch_image(self, url: str) -> Optional[bytes]:
         if self._image_fetcher is not None:
@@ -266,84 +426,128 @@ class ImageAnalysisService:
         if self._http_client is None:
             raise RuntimeError("ImageAnalysisService not started")
 
+        max_bytes = self._config.max_image_bytes
         try:
-            response = await self._http_client.get(url)
-            response.raise_for_status()
-            content = response.content
-            if len(content) > self._config.max_image_bytes:
-                logger.warning("Image exceeds max size limit", url=url)
-                return None
-            return content
+            # Stream the body so oversized responses are abandoned mid-flight;
+            # images are already compressed, so skip transfer encoding too
+            async with self._http_client.stream(
+                "GET", url, headers={"Accept-Encoding": "identity"}
+            ) as response:
+                response.raise_for_status()
+                declared_size = response.headers.get("Content-Length")
+                if declared_size and declared_size.isdigit() and int(declared_size) > max_bytes:
+                    logger.warning("Image exceeds max size limit", url=url)
+                    return None
+
+                content = bytearray()
+                async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                    content += chunk
+                    if len(content) > max_bytes:
+                        logger.warning("Image exceeds max size limit", url=url)
+                        return None
+                return bytes(content)
         except httpx.HTTPError:
             logger.warning("Failed to download image", url=url)
             return None
 
-    def _build_fingerprint(self, listing_id: int, url: str, data: bytes) -> Optional[ImageFingerprint]:
-        buffer = io.BytesIO(data)
-        try:
-            with Image.open(buffer) as img:
-                img = img.convert("RGB")
-                hash_value = imagehash.phash(img)
-                width, height = img.size
-        except (UnidentifiedImageError, OSError):
-            logger.warning("Unsupported image format", url=url)
-            return None
+    def _build_fingerprint(
+        self, listing_id: int, url: str, data: bytes, now: datetime
+    ) -> Optional[ImageFingerprint]:
+        # Stock photos and brand assets recur across listings; skip the decode
+        # when the exact same bytes were hashed recently
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        cached = self._get_cached_hash(digest)
+        if cached is not None:
+            hash_bits, width, height = cached
+        else:
+            buffer = io.BytesIO(data)
+            try:
+                with Image.open(buffer) as img:
+                    width, height = img.size
+                    # Let the JPEG decoder scale down by up to 8x and emit
+                    # luminance directly while decoding; a no-op for other formats
+                    img.draft("L", PHASH_INPUT_SIZE)
+                    hash_bits = _phash_bits(img)
+            except (UnidentifiedImageError, OSError):
+                logger.warning("Unsupported image format", url=url)
+                return None
+            self._cache_hash(digest, (hash_bits, width, height))
 
-        hash_hex = hash_value.__str__()
-        hash_bits = self._hash_to_int(hash_value)
+        hash_hex = f"{hash_bits:0{HASH_BIT_LENGTH // 4}x}"
 
         fingerprint = ImageFingerprint(
             listing_id=listing_id,
             image_url=url,
             hash_method=self._config.hash_method,
             hash_hex=hash_hex,
-            hash_bits=hash_bits,
+            hash_bits=_to_bigint(hash_bits),
             width=width,
             height=height,
             file_size=len(data),
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
+            created_at=now,
+            updated_at=now,
         )
         return fingerprint
 
-    def _hash_to_int(self, hash_value: imagehash.ImageHash) -> int:
-        array = np.array(hash_value.hash, dtype=np.uint8).reshape(-1)
-        result = 0
-        for bit in array:
-            result = (result << 1) | int(bit)
-        return result
-
-    def _update_similarity_matches(
+    def _get_cached_hash(self, digest: bytes) -> Optional[Tuple[int, int, int]]:
+        with self._hash_cache_lock:
+            entry = self._hash_cache.get(digest)
+            if entry is not None:
+                self._hash_cache.move_to_end(digest)
+            return entry
+
+    def _cache_hash(self, digest: bytes, entry: Tuple[int, int, int]) -> None:
+        with self._hash_cache_lock:
+            self._hash_cache[digest] = entry
+            self._hash_cache.move_to_end(digest)
+            while len(self._hash_cache) > self._config.hash_cache_size:
+                self._hash_cache.popitem(last=False)
+
+    def _band_filters(
+        self, fingerprints: Iterable[ImageFingerprint]
+    ) -> List[Tuple[int, int, int]]:
+        bands = _split_hash_bands(self._config.phash_threshold)
+        filters = {
+            (
+                shift,
+                _to_bigint(mask),
+                _to_bigint((self._fingerprint_bits(fingerprint) >> shift) & mask),
+            )
+            for fingerprint in fingerprints
+            for shift, mask in bands
+        }
+        return sorted(filters)
+
+    def _fingerprint_bits(self, fingerprint: ImageFingerprint) -> int:
+        # hash_bits is stored signed; mask it back to the unsigned hash
+        if fingerprint.hash_bits is not None:
+            return fingerprint.hash_bits & ((1 << HASH_BIT_LENGTH) - 1)
+        return int(fingerprint.hash_hex, 16)
+
+    def _collect_similarity_hits(
         self,
-        fingerprint: ImageFingerprint,
-        candidates: Iterable[ImageFingerprint],
-        matches: List[Tuple[ImageFingerprint, int]],
+        query_bits: np.ndarray,
+        candidates: Sequence[Row],
+        hits: List[Tuple[int, int]],
     ) -> None:
-        for candidate in candidates:
-            if candidate.hash_method != fingerprint.hash_method:
-                continue
-
-            candidate_bits = (
-                candidate.hash_bits
-                if candidate.hash_bits is not None
-                else int(candidate.hash_hex, 16)
-            )
-            diff = self._hamming_distance(
-                fingerprint.hash_bits or int(fingerprint.hash_hex, 16),
-                candidate_bits,
-            )
-            if diff <= self._config.phash_threshold:
-                matches.append((candidate, diff))
+        if not candidates:
+            return
 
-    def _hamming_distance(self, a: int, b: int) -> int:
-        return int(bin(a ^ b).count("1"))
+        candidate_bits = np.fromiter(
+            (self._fingerprint_bits(candidate) for candidate in candidates),
+            dtype=np.uint64,
+            count=len(candidates),
+        )
+        for bits in query_bits:
+            diffs = np.bitwise_count(candidate_bits ^ bits)
+            for index in np.flatnonzero(diffs <= self._config.phash_threshold):
+                hits.append((candidates[index].id, int(diffs[index])))
 
     def _estimate_confidence(self, diffs: Sequence[int]) -> float:
         if not diffs:
             return 0.0
-        bit_length = 64  # phash outputs 64-bit hashes
         best = min(diffs)
-        return round(1 - (best / bit_length), 3)
+        return round(1 - (best / HASH_BIT_LENGTH), 3)
 
     async def _propagate_matches(
         self,
@@ -351,19 +555,26 @@ class ImageAnalysisService:
         *,
         source_listing: Listing,
         match_fingerprints: Sequence[Tuple[ImageFingerprint, int]],
-        matched_listings: Dict[int, Listing],
+        matched_listings: Dict[int, Row],
     ) -> None:
         if not matched_listings:
             return
 
+        # Collect every new match per listing first, then write them all in
+        # one bulk UPDATE instead of touching each listing per fingerprint
+        metas: Dict[int, Dict[str, Any]] = {}
         for fingerprint, diff in match_fingerprints:
             listing = matched_listings.get(fingerprint.listing_id)
             if listing is None:
                 continue
 
-            meta = listing.suspicion_meta or {"matches": []}
-            matches = meta.setdefault("matches", [])
-            matches.append(
+            meta = metas.get(listing.id)
+            if meta is None:
+                # Build a fresh dict so the stored JSON is never mutated in place
+                meta = dict(listing.suspicion_meta or {})
+                meta["matches"] = list(meta.get("matches", []))
+                metas[listing.id] = meta
+            meta["matches"].append(
                 {
                     "listing_id": source_listing.id,
                     "external_id": source_listing.external_id,
@@ -375,9 +586,8 @@ class ImageAnalysisService:
             )
             meta["hash_method"] = self._config.hash_method
 
-            await repo.mark_suspicion(
-                listing,
-                reason="duplicate-image",
-                confidence=None,
-                meta=meta,
-            )
+        await repo.mark_suspicion_many(
+            metas,
+            reason="duplicate-image",
+            confidence=None,
+        )
@@ -11,10 +11,12 @@ from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from events import ListingImagesUpdated
 from repositories import ListingRepository, SchedulerJobRepository
+from schemas import SchedulerJobCreate
 from services.event_bus import EventBus
 from services.kleinanzeigen import fetch_listings, fetch_listing_details
 
@@ -60,6 +62,9 @@ class SchedulerJobState:
         return meta
 
 
+_JOB_PARAM_KEYS = {"query", "location", "radius", "min_price", "max_price", "page_count"}
+
+
 def _default_interval() -> int:
     try:
         return int(os.getenv("SCRAPER_INTERVAL_SECONDS", "3600"))
@@ -97,21 +102,30 @@ def load_job_configs() -> List[ScraperJobConfig]:
             logger.warning("Invalid interval for job; using default", job=name, interval=interval)
             interval_seconds = default_interval
 
-        params = {
-            "query": item.get("query"),
-            "location": item.get("location"),
-            "radius": item.get("radius"),
-            "min_price": item.get("min_price"),
-            "max_price": item.get("max_price"),
-            "page_count": int(item.get("page_count", 1) or 1),
-        }
-        is_active = bool(item.get("is_active", True))
-        configs.append(
-            ScraperJobConfig(
+        # Validate env jobs like API-created ones, so stored params always
+        # have the types the scheduler and its responses expect
+        try:
+            job = SchedulerJobCreate(
                 name=name,
+                query=item.get("query"),
+                location=item.get("location"),
+                radius=item.get("radius"),
+                min_price=item.get("min_price"),
+                max_price=item.get("max_price"),
+                page_count=item.get("page_count") or 1,
                 interval_seconds=interval_seconds,
-                params=params,
-                is_active=is_active,
+                is_active=bool(item.get("is_active", True)),
+            )
+        except ValidationError as exc:
+            logger.warning("Ignoring invalid job definition", job=name, error=str(exc))
+            continue
+
+        configs.append(
+            ScraperJobConfig(
+                name=job.name,
+                interval_seconds=job.interval_seconds,
+                params=job.model_dump(include=_JOB_PARAM_KEYS),
+                is_active=job.is_active,
             )
         )
 
@@ -0,0 +1,152 @@
+import asyncio
+import functools
+
+import pytest
+
+from services.event_bus import EventBus
+
+
+class BaseEvent:
+    pass
+
+
+class ChildEvent(BaseEvent):
+    pass
+
+
+async def drain() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_handlers_for_base_classes_receive_subclass_events():
+    bus = EventBus()
+    received = []
+
+    async def on_base(event):
+        received.append(("base", type(event).__name__))
+
+    async def on_child(event):
+        received.append(("child", type(event).__name__))
+
+    bus.subscribe(BaseEvent, on_base)
+    bus.subscribe(ChildEvent, on_child)
+
+    await bus.publish(ChildEvent())
+    await bus.publish(BaseEvent())
+    await drain()
+
+    assert sorted(received) == [
+        ("base", "BaseEvent"),
+        ("base", "ChildEvent"),
+        ("child", "ChildEvent"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sync_handlers_run_inline_and_async_handlers_in_background():
+    bus = EventBus()
+    received = []
+
+    def on_sync(event):
+        received.append("sync")
+
+    async def on_async(event):
+        received.append("async")
+
+    bus.subscribe(BaseEvent, on_sync)
+    bus.subscribe(BaseEvent, on_async)
+
+    await bus.publish(BaseEvent())
+    assert received == ["sync"]
+
+    await drain()
+    assert received == ["sync", "async"]
+
+
+@pytest.mark.asyncio
+async def test_awaitables_returned_by_sync_callables_are_awaited():
+    bus = EventBus()
+    received = []
+
+    async def record(tag, event):
+        received.append(tag)
+
+    bus.subscribe(BaseEvent, lambda event: record("lambda", event))
+    bus.subscribe(BaseEvent, functools.partial(record, "partial"))
+
+    await bus.publish(BaseEvent())
+    await drain()
+
+    assert sorted(received) == ["lambda", "partial"]
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_cancel_siblings():
+    bus = EventBus()
+    finished = []
+
+    async def failing(event):
+        raise RuntimeError("boom")
+
+    async def slow(event):
+        await asyncio.sleep(0.01)
+        finished.append("slow")
+
+    bus.subscribe(BaseEvent, failing)
+    bus.subscribe(BaseEvent, slow)
+
+    await bus.publish(BaseEvent())
+    await bus.stop()
+
+    assert finished == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_stop_waits_for_handlers_then_cancels_stragglers():
+    bus = EventBus(shutdown_timeout=0.05)
+    finished = []
+    cancelled = asyncio.Event()
+
+    async def quick(event):
+        await asyncio.sleep(0.01)
+        finished.append("quick")
+
+    async def stuck(event):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    bus.subscribe(ChildEvent, quick)
+    bus.subscribe(BaseEvent, stuck)
+
+    await bus.publish(ChildEvent())
+    started = asyncio.get_running_loop().time()
+    await bus.stop()
+    elapsed = asyncio.get_running_loop().time() - started
+
+    assert finished == ["quick"]
+    assert cancelled.is_set()
+    assert 0.04 <= elapsed < 1
+
+
+@pytest.mark.asyncio
+async def test_events_are_dropped_after_stop_until_restarted():
+    bus = EventBus()
+    received = []
+
+    def on_event(event):
+        received.append(event)
+
+    bus.subscribe(BaseEvent, on_event)
+
+    await bus.stop()
+    await bus.publish(BaseEvent())
+    assert received == []
+
+    await bus.start()
+    await bus.publish(BaseEvent())
+    assert len(received) == 1
@@ -1,5 +1,8 @@
+import asyncio
 import io
 import os
+import random
+from datetime import datetime, timezone
 from typing import List
 
 import pytest
@@ -10,9 +13,17 @@ os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
 pytest.importorskip("sqlalchemy")
 
 from db import init_db, get_session_factory, reset_database_state  # noqa: E402
+from db.models import ImageFingerprint  # noqa: E402
 from events import ListingImagesUpdated  # noqa: E402
-from repositories import ListingRepository  # noqa: E402
-from services.image_analysis import ImageAnalysisService  # noqa: E402
+from repositories import ImageFingerprintRepository, ListingRepository  # noqa: E402
+from services.image_analysis import (  # noqa: E402
+    HASH_BIT_LENGTH,
+    AnalysisConfig,
+    ImageAnalysisService,
+    _phash_bits,
+    _split_hash_bands,
+    _to_bigint,
+)
 
 
 def create_image_bytes(color: str) -> bytes:
@@ -109,3 +120,221 @@ async def test_duplicate_images_mark_listings_suspicious(session_factory):
         assert listing2.suspicion_reason == "duplicate-image"
         assert listing2.suspicion_meta is not None
         assert listing2.suspicion_meta["matches"]
+
+
+def flip_bits(value: int, rng: random.Random, count: int) -> int:
+    for bit in rng.sample(range(HASH_BIT_LENGTH), count):
+        value ^= 1 << bit
+    return value
+
+
+@pytest.mark.parametrize("threshold", [0, 1, 5, 10, 63, 100])
+def test_hash_bands_partition_every_bit(threshold):
+    bands = _split_hash_bands(threshold)
+
+    assert len(bands) == min(threshold + 1, HASH_BIT_LENGTH)
+    covered = 0
+    for shift, mask in bands:
+        band = mask << shift
+        assert covered & band == 0
+        covered |= band
+    assert covered == (1 << HASH_BIT_LENGTH) - 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threshold", [0, 5])
+async def test_band_prefilter_returns_every_hash_within_threshold(
+    session_factory, threshold
+):
+    rng = random.Random(threshold)
+    # Set the top bit so the query only fits the BIGINT column as a negative value
+    query_bits = rng.getrandbits(HASH_BIT_LENGTH) | (1 << (HASH_BIT_LENGTH - 1))
+    near = {flip_bits(query_bits, rng, distance) for distance in range(threshold + 1)}
+    far = {flip_bits(query_bits, rng, 20) for _ in range(10)}
+
+    async with session_factory() as session:
+        result = await ListingRepository(session).upsert_listing(
+            {"adid": "stored", "title": "Stored"}, None, "job", {}
+        )
+        await session.flush()
+        fingerprint_repo = ImageFingerprintRepository(session)
+        for index, bits in enumerate(sorted(near | far)):
+            await fingerprint_repo.add_fingerprint(
+                listing_id=result.listing.id,
+                image_url=f"https://example.com/{index}.png",
+                hash_method="phash",
+                hash_hex=f"{bits:016x}",
+                hash_bits=_to_bigint(bits),
+                width=64,
+                height=64,
+                file_size=1,
+            )
+        await session.commit()
+
+    service = ImageAnalysisService(
+        session_factory=session_factory,
+        event_bus=StubEventBus(),
+        config=AnalysisConfig(phash_threshold=threshold),
+    )
+    query = ImageFingerprint(
+        hash_hex=f"{query_bits:016x}", hash_bits=_to_bigint(query_bits)
+    )
+
+    async with session_factory() as session:
+        rows = [
+            row
+            async for batch in ImageFingerprintRepository(
+                session
+            ).stream_band_candidate_hashes(
+                hash_method="phash", bands=service._band_filters([query])
+            )
+            for row in batch
+        ]
+
+    found = {row.hash_bits & ((1 << HASH_BIT_LENGTH) - 1) for row in rows}
+    assert near <= found
+    if threshold == 0:
+        assert found == {query_bits}
+
+
+@pytest.mark.asyncio
+async def test_reanalysis_only_hashes_new_images_and_drops_stale_ones(session_factory):
+    image_store = {
+        "https://example.com/a.png": create_image_bytes("red"),
+        "https://example.com/b.png": create_image_bytes("green"),
+        "https://example.com/c.png": create_image_bytes("blue"),
+    }
+    fetched: List[str] = []
+
+    async def fetcher(url: str):
+        fetched.append(url)
+        return image_store[url]
+
+    service = ImageAnalysisService(
+        session_factory=session_factory,
+        event_bus=StubEventBus(),
+        image_fetcher=fetcher,
+    )
+
+    async with session_factory() as session:
+        result = await ListingRepository(session).upsert_listing(
+            {"adid": "a", "title": "A"}, None, "job", {}
+        )
+        await session.commit()
+    listing_id = result.listing.id
+
+    async def analyse(urls: List[str]):
+        await service._handle_event(
+            ListingImagesUpdated(
+                listing_id=listing_id, external_id="a", image_urls=urls
+            )
+        )
+        async with session_factory() as session:
+            stored = await ImageFingerprintRepository(session).list_by_listing(
+                listing_id
+            )
+        return {fingerprint.image_url: fingerprint.id for fingerprint in stored}
+
+    first = await analyse(["https://example.com/a.png", "https://example.com/b.png"])
+    second = await analyse(["https://example.com/b.png", "https://example.com/c.png"])
+
+    assert set(second) == {"https://example.com/b.png", "https://example.com/c.png"}
+    # The unchanged image keeps its row and is not downloaded again
+    assert second["https://example.com/b.png"] == first["https://example.com/b.png"]
+    assert sorted(fetched) == sorted(image_store)
+
+
+def other_tasks() -> set:
+    return asyncio.all_tasks() - {asyncio.current_task()}
+
+
+@pytest.mark.asyncio
+async def test_compute_fingerprints_bounds_downloads_and_skips_missing_images():
+    in_flight = 0
+    peak = 0
+
+    async def fetcher(url: str):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return None if url.endswith("missing.png") else create_image_bytes("red")
+
+    config = AnalysisConfig(parallel_downloads=2)
+    service = ImageAnalysisService(
+        session_factory=None,
+        event_bus=StubEventBus(),
+        config=config,
+        image_fetcher=fetcher,
+    )
+    urls = [f"https://example.com/{index}.png" for index in range(8)]
+    urls += ["https://example.com/missing.png", urls[0]]
+
+    fingerprints = [
+        fingerprint
+        async for fingerprint in service._compute_fingerprints(
+            1, urls, datetime.now(timezone.utc)
+        )
+    ]
+
+    assert sorted(fingerprint.image_url for fingerprint in fingerprints) == sorted(
+        urls[:8]
+    )
+    assert peak <= config.parallel_downloads
+    assert not other_tasks()
+
+
+@pytest.mark.asyncio
+async def test_compute_fingerprints_propagates_download_errors():
+    async def fetcher(url: str):
+        if url.endswith("broken.png"):
+            raise RuntimeError("download failed")
+        await asyncio.sleep(0.01)
+        return create_image_bytes("red")
+
+    service = ImageAnalysisService(
+        session_factory=None, event_bus=StubEventBus(), image_fetcher=fetcher
+    )
+    urls = [f"https://example.com/{index}.png" for index in range(5)]
+    urls.append("https://example.com/broken.png")
+
+    with pytest.raises(RuntimeError, match="download failed"):
+        async for _ in service._compute_fingerprints(
+            1, urls, datetime.now(timezone.utc)
+        ):
+            pass
+
+    assert not other_tasks()
+
+
+@pytest.mark.asyncio
+async def test_compute_fingerprints_cancels_workers_when_closed_early():
+    async def fetcher(url: str):
+        await asyncio.sleep(0.01)
+        return create_image_bytes("red")
+
+    service = ImageAnalysisService(
+        session_factory=None, event_bus=StubEventBus(), image_fetcher=fetcher
+    )
+    urls = [f"https://example.com/{index}.png" for index in range(10)]
+
+    fingerprints = service._compute_fingerprints(1, urls, datetime.now(timezone.utc))
+    first = await anext(fingerprints)
+    await fingerprints.aclose()
+
+    assert first.image_url in urls
+    assert not other_tasks()
+
+
+def test_phash_matches_imagehash_reference():
+    imagehash = pytest.importorskip("imagehash")
+    np = pytest.importorskip("numpy")
+
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        width, height = rng.integers(16, 256, size=2)
+        pixels = rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+        image = Image.fromarray(pixels, "RGB")
+
+        assert _phash_bits(image) == int(str(imagehash.phash(image)), 16)
@@ -0,0 +1,130 @@
+import pytest
+
+pytest.importorskip("playwright")
+
+from libs.websites import kleinanzeigen as lib  # noqa: E402
+
+
+# Shaped like the object returned by DETAIL_PAGE_JS for a typical listing.
+DETAIL_PAGE_PAYLOAD = {
+    "adId": "2901234567",
+    "categories": ["Elektronik", "Handy & Telefon"],
+    "title": "iPhone 13 128GB",
+    "titleClass": "boxedarticle--title",
+    "soldBadge": False,
+    "price": " 1.234,50 € VB ",
+    "views": "87",
+    "description": "Kaum benutzt.",
+    "imageSrc": "https://img.kleinanzeigen.de/api/v1/prod-ads/images/ab/cd.jpg",
+    "seller": {
+        "name": " Max ",
+        "detailTexts": ["Gewerblicher Nutzer", "Aktiv seit 12.03.2015"],
+        "badges": [" Freundlich ", "", "  ", "Zuverlässig"],
+    },
+    "details": [
+        {"content": "Zustand\n  Sehr gut", "value": "Sehr gut"},
+        {"content": "Versand möglich", "value": None},
+        {"content": "Farbe Schwarz ", "value": "Schwarz "},
+    ],
+    "features": [" Originalverpackung ", "", "Garantie"],
+    "shipping": "Versand ab 4,99 €",
+    "locality": "10115 Berlin - Mitte",
+    "createdAt": "01.02.2024",
+}
+
+
+def test_parse_price_reads_amount_and_negotiable_flag():
+    assert lib.parse_price(DETAIL_PAGE_PAYLOAD["price"]) == {
+        "amount": "1234.50",
+        "currency": "€",
+        "negotiable": True,
+    }
+    assert lib.parse_price("250 €") == {
+        "amount": "250",
+        "currency": "€",
+        "negotiable": False,
+    }
+
+
+@pytest.mark.parametrize("price_text", [None, ""])
+def test_parse_price_defaults_when_missing(price_text):
+    assert lib.parse_price(price_text) == {
+        "amount": "0",
+        "currency": "€",
+        "negotiable": False,
+    }
+
+
+def test_parse_seller_details_reads_payload():
+    assert lib.parse_seller_details(DETAIL_PAGE_PAYLOAD["seller"]) == {
+        "name": " Max ",
+        "since": "12.03.2015",
+        "type": "business",
+        "badges": ["Freundlich", "Zuverlässig"],
+    }
+
+
+def test_parse_seller_details_matches_case_insensitively():
+    seller = {
+        "name": "Erika",
+        "detailTexts": ["GEWERBLICHER   nutzer", "aktiv SEIT\n01.01.2020"],
+        "badges": [],
+    }
+
+    result = lib.parse_seller_details(seller)
+
+    assert result["type"] == "business"
+    assert result["since"] == "01.01.2020"
+
+
+def test_parse_seller_details_defaults_when_fields_missing():
+    seller = {"name": None, "detailTexts": [], "badges": None}
+
+    assert lib.parse_seller_details(seller) == {
+        "name": None,
+        "since": None,
+        "type": "private",
+        "badges": [],
+    }
+    assert (
+        lib.parse_seller_details({"detailTexts": ["Privater Nutzer"]})["type"]
+        == "private"
+    )
+
+
+def test_parse_details_strips_value_from_label():
+    assert lib.parse_details(DETAIL_PAGE_PAYLOAD["details"]) == {
+        "Zustand": "Sehr gut",
+        "Farbe": "Schwarz",
+    }
+
+
+def test_parse_features_drops_blank_entries():
+    assert lib.parse_features(DETAIL_PAGE_PAYLOAD["features"]) == [
+        "Originalverpackung",
+        "Garantie",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("locality", "expected"),
+    [
+        ("10115 Berlin - Mitte", {"zip": "10115", "city": "Mitte", "state": "Berlin"}),
+        ("80331 Bayern", {"zip": "80331", "city": "", "state": "Bayern"}),
+        ("80331", {"zip": "80331", "city": "", "state": ""}),
+        (None, {"zip": "", "city": "", "state": ""}),
+    ],
+)
+def test_parse_location(locality, expected):
+    assert lib.parse_location(locality) == expected
+
+
+def test_parse_extra_info_reads_created_at_and_views():
+    assert lib.parse_extra_info(DETAIL_PAGE_PAYLOAD) == {
+        "created_at": "01.02.2024",
+        "views": "87",
+    }
+    assert lib.parse_extra_info({"createdAt": None, "views": None}) == {
+        "created_at": None,
+        "views": "0",
+    }
@@ -73,3 +73,36 @@ async def test_upsert_and_retrieve_listing(session):
     assert listing is not None
     assert listing.price_amount == "450"
     assert listing.price_negotiable is True
+
+
+@pytest.mark.asyncio
+async def test_mark_suspicion_many_flags_every_listing(session):
+    repo = ListingRepository(session)
+    first = await repo.upsert_listing({"adid": "1", "title": "Eins"}, None, "job", {})
+    second = await repo.upsert_listing({"adid": "2", "title": "Zwei"}, None, "job", {})
+    await repo.upsert_listing({"adid": "3", "title": "Drei"}, None, "job", {})
+    await session.commit()
+    first_id, second_id = first.listing.id, second.listing.id
+
+    await repo.mark_suspicion_many(
+        {
+            first_id: {"matches": [{"listing_id": second_id}]},
+            second_id: {"matches": [{"listing_id": first_id}]},
+        },
+        reason="duplicate-image",
+        confidence=0.9,
+    )
+    await session.commit()
+    # The bulk UPDATE bypasses the identity map; reload from the database
+    session.expire_all()
+
+    for external_id, match_id in (("1", second_id), ("2", first_id)):
+        listing = await repo.get_by_external_id(external_id)
+        assert listing.is_suspicious is True
+        assert listing.suspicion_reason == "duplicate-image"
+        assert listing.suspicion_confidence == 0.9
+        assert listing.suspicion_meta == {"matches": [{"listing_id": match_id}]}
+        assert listing.last_analyzed_at is not None
+
+    untouched = await repo.get_by_external_id("3")
+    assert untouched.is_suspicious is False
@@ -170,6 +170,11 @@ class EventLoopOptimizer:
             print("uvloop not available, using default event loop")
             return False
 
+    @staticmethod
+    def uses_uvloop() -> bool:
+        """Return True if the running event loop is provided by uvloop."""
+        return type(asyncio.get_running_loop()).__module__.startswith("uvloop")
+
     @staticmethod
     def optimize_event_loop():
         """Apply event loop optimizations."""
@@ -255,7 +260,6 @@ class MemoryOptimizedProcessor:
     async def cleanup(self):
         """Clean up resources."""
         await self.task_manager.cancel_all()
-        gc.collect()
 
 
 @asynccontextmanager
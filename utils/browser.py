@@ -1,8 +1,106 @@
 import asyncio
-from typing import List
+import json
+import logging
+import os
+import time
+from typing import Dict, List, Optional
 from playwright.async_api import async_playwright, BrowserContext, Page
 from utils.user_agent import get_random_ua
 
+logger = logging.getLogger(__name__)
+
+# Only text and attributes are scraped, so these downloads are never used.
+# Stylesheets stay enabled because some waits rely on element visibility.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
+# Pre-accepts the consent banner in every page of a context before site
+# scripts run, so no page pays for the consent handshake on its own
+CONSENT_INIT_SCRIPT = """
+try { window.localStorage.setItem("gdpr-consent", "accepted"); } catch (e) {}
+document.cookie = "consent=1; path=/";
+"""
+
+
+# Persisted cookies expire, so the file is rewritten after this many seconds
+STORAGE_STATE_REFRESH_SECONDS = 15 * 60
+
+
+def get_storage_state_path() -> Optional[str]:
+    """Return the file used to carry cookies and consent state between contexts.
+
+    Persistence is opt-in: nothing is written unless BROWSER_STORAGE_STATE
+    names a file, which should live outside the source tree. Processes that
+    run side by side should each be given their own path.
+    """
+    path = os.getenv("BROWSER_STORAGE_STATE")
+    return os.path.abspath(os.path.expanduser(path)) if path else None
+
+
+async def block_heavy_resources(route):
+    """Playwright route handler that aborts image, media and font requests"""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _write_storage_state(path: str, state: dict):
+    """Replace the storage state file atomically so readers never see a partial write"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(state, handle)
+    os.replace(tmp_path, path)
+
+
+class PagePool:
+    """Reuses the pages of one browser context across fetches.
+
+    Opening and closing a page costs CDP round-trips of its own; workers
+    instead hand pages back for the next URL. A page is closed once it has
+    served max_uses navigations so long-lived documents cannot leak.
+    """
+
+    def __init__(self, context: BrowserContext, max_uses: int = 50):
+        self._context = context
+        self._max_uses = max_uses
+        self._idle: asyncio.Queue[Page] = asyncio.Queue()
+        self._uses: Dict[Page, int] = {}
+
+    async def acquire(self) -> Page:
+        """Return an idle page, opening a new one when none is free"""
+        while not self._idle.empty():
+            page = self._idle.get_nowait()
+            if not page.is_closed():
+                return page
+            self._uses.pop(page, None)
+
+        page = await self._context.new_page()
+        self._uses[page] = 0
+        return page
+
+    async def release(self, page: Page):
+        """Hand a page back after a successful navigation"""
+        uses = self._uses.get(page, 0) + 1
+        if uses >= self._max_uses or page.is_closed():
+            await self.discard(page)
+            return
+        self._uses[page] = uses
+        self._idle.put_nowait(page)
+
+    async def discard(self, page: Page):
+        """Close a page that should not be reused, e.g. after a failed load"""
+        self._uses.pop(page, None)
+        if not page.is_closed():
+            await page.close()
+
+    async def close(self):
+        """Close every page the pool has opened"""
+        for page in list(self._uses):
+            await self.discard(page)
+        while not self._idle.empty():
+            self._idle.get_nowait()
+
 
 class PlaywrightManager:
     def __init__(self):
@@ -17,6 +115,13 @@ class PlaywrightManager:
         context = await self._browser.new_context(user_agent=get_random_ua())
         return await context.new_page()
 
+    async def get_context(self) -> BrowserContext:
+        """Create a context that callers can share across several pages"""
+        return await self._browser.new_context(user_agent=get_random_ua())
+
+    async def release_context(self, context: BrowserContext):
+        await context.close()
+
     async def close_page(self, page):
         await page.close()
 
@@ -34,8 +139,13 @@ class OptimizedPlaywrightManager:
         self._context_pool: List[BrowserContext] = []
         self._context_in_use: List[BrowserContext] = []
         self._max_contexts = max_contexts
+        self._semaphore_capacity = max_concurrent
         self._semaphore = asyncio.Semaphore(max_concurrent)
         self._context_lock = asyncio.Lock()
+        self._storage_state_path = get_storage_state_path()
+        self._has_storage_state = False
+        self._storage_state_saved_at: Optional[float] = None
+        self._saving_storage_state = False
 
         # Performance metrics
         self._contexts_created = 0
@@ -47,14 +157,55 @@ class OptimizedPlaywrightManager:
         """Initialize the browser and create initial context pool"""
         self._playwright = await async_playwright().start()
         self._browser = await self._playwright.chromium.launch(headless=True)
+        self._has_storage_state = bool(
+            self._storage_state_path and os.path.exists(self._storage_state_path)
+        )
 
         # Pre-create some contexts for the pool
         initial_contexts = min(3, self._max_contexts)
         for _ in range(initial_contexts):
-            context = await self._browser.new_context(user_agent=get_random_ua())
+            context = await self._new_context()
             self._context_pool.append(context)
             self._contexts_created += 1
 
+    async def _new_context(self) -> BrowserContext:
+        """Create a context, seeded with persisted cookies once they exist"""
+        storage_state = self._storage_state_path if self._has_storage_state else None
+        context = await self._browser.new_context(
+            user_agent=get_random_ua(), storage_state=storage_state
+        )
+        await context.add_init_script(CONSENT_INIT_SCRIPT)
+        return context
+
+    async def save_storage_state(self, context: BrowserContext):
+        """Persist the cookies of a context that loaded a page successfully"""
+        if not self._storage_state_path or self._saving_storage_state:
+            return
+        if (
+            self._storage_state_saved_at is not None
+            and time.monotonic() - self._storage_state_saved_at
+            < STORAGE_STATE_REFRESH_SECONDS
+        ):
+            return
+        # Guard against concurrent pages writing the file at the same time
+        self._saving_storage_state = True
+        try:
+            state = await context.storage_state()
+            await asyncio.to_thread(
+                _write_storage_state, self._storage_state_path, state
+            )
+            self._has_storage_state = True
+        except Exception:
+            logger.warning(
+                "Failed to persist browser storage state to %s",
+                self._storage_state_path,
+                exc_info=True,
+            )
+        finally:
+            # Failed attempts also wait for the next refresh window
+            self._storage_state_saved_at = time.monotonic()
+            self._saving_storage_state = False
+
     async def get_context(self) -> BrowserContext:
         """Get a browser context from the pool or create a new one"""
         async with self._context_lock:
@@ -66,7 +217,7 @@ class OptimizedPlaywrightManager:
 
             # Create new context if pool is empty and under limit
             if len(self._context_in_use) < self._max_contexts:
-                context = await self._browser.new_context(user_agent=get_random_ua())
+                context = await self._new_context()
                 self._context_in_use.append(context)
                 self._contexts_created += 1
                 return context
@@ -119,6 +270,11 @@ class OptimizedPlaywrightManager:
         if context:
             await self.release_context(context)
 
+    @property
+    def semaphore_capacity(self) -> int:
+        """Maximum number of operations execute_with_semaphore runs at once"""
+        return self._semaphore_capacity
+
     def get_performance_metrics(self) -> dict:
         """Get current performance metrics"""
         return {
@@ -7,6 +7,7 @@ while maintaining comprehensive debugging information.
 """
 
 import logging
+import random
 import time
 import traceback
 from enum import Enum
@@ -349,6 +350,8 @@ class WarningManager:
     Manager for collecting and organizing warnings during operations.
     """
 
+    __slots__ = ("_warning_counts", "warnings")
+
     def __init__(self):
         self.warnings: List[Warning] = []
         self._warning_counts: Dict[str, int] = {}
@@ -573,6 +576,21 @@ class ErrorLogger:
             self.logger.info(f"Error breakdown for {operation}: {error_categories}")
 
 
+# Exponential backoff bases (1, 2, 4, ... seconds) indexed by retry attempt;
+# later attempts reuse the last entry and every wait is capped
+_BACKOFF_BASES = tuple(float(1 << i) for i in range(6))
+_MAX_BACKOFF_INDEX = len(_BACKOFF_BASES) - 1
+_MAX_RETRY_WAIT_SECONDS = 30.0
+
+
+def retry_delay(attempt: int) -> float:
+    """Seconds to wait before retrying after the given zero-based attempt, with jitter."""
+    return min(
+        _MAX_RETRY_WAIT_SECONDS,
+        _BACKOFF_BASES[min(attempt, _MAX_BACKOFF_INDEX)] + random.random(),
+    )
+
+
 @contextmanager
 def error_handling_context(
     operation: str,
@@ -96,6 +96,13 @@ class RequestMetrics:
 class PerformanceTracker:
     """Utility class for tracking performance metrics during operations."""
 
+    __slots__ = (
+        "browser_contexts_used",
+        "concurrent_level",
+        "page_metrics",
+        "start_time",
+    )
+
     def __init__(self):
         self.start_time: Optional[float] = None
         self.page_metrics: List[PageMetrics] = []
@@ -104,7 +111,7 @@ class PerformanceTracker:
 
     def start_request(self) -> None:
         """Mark the start of a request operation."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.page_metrics.clear()
 
     def add_page_metric(self, page_metric: PageMetrics) -> None:
@@ -124,7 +131,7 @@ class PerformanceTracker:
         if self.start_time is None:
             raise ValueError("Request tracking not started")
 
-        total_time = time.time() - self.start_time
+        total_time = time.perf_counter() - self.start_time
         pages_successful = sum(1 for pm in self.page_metrics if pm.success)
         pages_failed = len(self.page_metrics) - pages_successful
 
@@ -155,7 +162,7 @@ async def track_page_performance(page_number: int, url: str):
         def __init__(self, page_num: int, page_url: str):
             self.page_number = page_num
             self.url = page_url
-            self.start_time = time.time()
+            self.start_time = time.perf_counter()
             self.results_count = 0
             self.retry_count = 0
             self.error_message: Optional[str] = None
@@ -176,7 +183,7 @@ async def track_page_performance(page_number: int, url: str):
                 page_number=self.page_number,
                 url=self.url,
                 start_time=self.start_time,
-                end_time=time.time(),
+                end_time=time.perf_counter(),
                 success=self.success,
                 retry_count=self.retry_count,
                 error_message=self.error_message,